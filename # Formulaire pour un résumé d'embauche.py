@@ -1,21 +1,99 @@
-# Formulaire pour un résumé d'embauche 
-
-print("Bienvenue au formulaire de résumé d'embauche!")
-
-nom = input("Veuillez entrer votre nom complet: ")
-age = input("Veuillez entrer votre âge: ")
-poste = input("Quel poste souhaitez-vous postuler? ")
-experience = input("Veuillez décrire brièvement votre expérience professionnelle: ")
-competences = input("Quelles sont vos compétences clés? ")
-disponibilite = input("Quelle est votre disponibilité pour commencer? ")
-print("\nMerci pour vos réponses! Voici un résumé de votre candidature:\n")
-
-# Affichage du résumé
-print(f"Nom complet: {nom}")
-print(f"Âge: {age}")
-print(f"Poste souhaité: {poste}")
-print(f"Expérience professionnelle: {experience}")
-print(f"Compétences clés: {competences}")
-print(f"Disponibilité pour commencer: {disponibilite}")
-
-# Ce script recueille des informations auprès d'un candidat à un emploi et affiche un résumé de sa candidature.
\ No newline at end of file
+# Formulaire pour un résumé d'embauche
+#
+# Sans argument, le formulaire pose les questions une par une. Avec --batch,
+# les candidatures d'un fichier CSV ou JSONL (ou de l'entrée standard avec
+# "-") sont validées et résumées en lot, en mémoire constante (voir candidats.py).
+# Avec --store, les candidatures sont aussi gardées dans un registre
+# interrogeable (voir candidate_store.py); --rebuild refait son index si le
+# journal a une ligne abîmée.
+#
+# Exemple :
+#     python "# Formulaire pour un résumé d'embauche.py"
+#     python "# Formulaire pour un résumé d'embauche.py" --batch candidats.csv --out resumes.txt
+#     cat candidats.jsonl | python "# Formulaire pour un résumé d'embauche.py" --batch - --format jsonl
+#     python "# Formulaire pour un résumé d'embauche.py" --bench 200000
+#     python "# Formulaire pour un résumé d'embauche.py" --store registre   # garde la candidature
+
+import argparse
+import sys
+
+import candidats
+from candidate_store import CandidateStore
+
+
+def formulaire(store=None):
+    print("Bienvenue au formulaire de résumé d'embauche!")
+
+    nom = input("Veuillez entrer votre nom complet: ")
+    age = input("Veuillez entrer votre âge: ")
+    poste = input("Quel poste souhaitez-vous postuler? ")
+    experience = input("Veuillez décrire brièvement votre expérience professionnelle: ")
+    competences = input("Quelles sont vos compétences clés? ")
+    disponibilite = input("Quelle est votre disponibilité pour commencer? ")
+    print("\nMerci pour vos réponses! Voici un résumé de votre candidature:\n")
+
+    # Affichage du résumé
+    print(f"Nom complet: {nom}")
+    print(f"Âge: {age}")
+    print(f"Poste souhaité: {poste}")
+    print(f"Expérience professionnelle: {experience}")
+    print(f"Compétences clés: {competences}")
+    print(f"Disponibilité pour commencer: {disponibilite}")
+
+    if store is not None:
+        try:
+            number = store.add({"nom": nom, "age": age, "poste": poste, "experience": experience,
+                                "competences": competences, "disponibilite": disponibilite})
+            print(f"\nCandidature enregistrée (numéro {number}).")
+        except candidats.InvalidRecord as error:
+            print(f"\nCandidature non enregistrée : {error}.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Formulaire pour un résumé d'embauche")
+    parser.add_argument("--batch", nargs="+", metavar="FICHIER",
+                        help="candidatures CSV ou JSONL à résumer ('-' = entrée standard)")
+    parser.add_argument("--format", choices=sorted(candidats.READERS),
+                        help="format des fichiers (sinon deviné par l'extension)")
+    parser.add_argument("--out", help="fichier des résumés (sinon la sortie standard)")
+    parser.add_argument("--bench", type=int, metavar="N",
+                        help="mesure les candidatures par seconde sur N candidatures générées")
+    parser.add_argument("--store", metavar="DOSSIER", help="garde aussi les candidatures dans ce registre")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="avec --store : reconstruit l'index du registre depuis son journal")
+    args = parser.parse_args()
+
+    if args.bench:
+        for fmt, rate in candidats.benchmark(args.bench).items():
+            print(f"{fmt:5s} : {rate:10.0f} candidatures/s")
+        return
+    if args.rebuild and not args.store:
+        parser.error("--rebuild demande --store")
+    store = CandidateStore(args.store, rebuild=args.rebuild) if args.store else None
+    if store is not None and store.skipped:
+        print(f"{store.skipped} lignes illisibles ignorées dans le registre", file=sys.stderr)
+    try:
+        if not args.batch:
+            formulaire(store)
+            return
+        out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+        try:
+            written, errors = candidats.run_batch(args.batch, out, args.format,
+                                                  sink=store.add if store else None)
+        finally:
+            if args.out:
+                out.close()
+    finally:
+        if store is not None:
+            store.close()
+    for number, reason in errors.first:
+        print(f"candidature {number} ignorée : {reason}", file=sys.stderr)
+    if errors.count > len(errors.first):
+        print(f"... et {errors.count - len(errors.first)} autres", file=sys.stderr)
+    print(f"{written} résumés écrits, {errors.count} candidatures invalides", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
+
+# Ce script recueille des informations auprès d'un candidat à un emploi et affiche un résumé de sa candidature.
@@ -0,0 +1,123 @@
+# Un seul thread de calcul pour l'IA, réutilisé pour toute la partie.
+#
+# L'interface envoie une copie figée de la position (TicTacToe.snapshot())
+# avec le numéro de « génération » courant. Chaque reset ou changement de
+# mode passe à la génération suivante : les réponses calculées pour une
+# ancienne partie sont simplement ignorées. Le délai de réflexion est un
+# budget : si le calcul prend déjà ce temps, la réponse part tout de suite,
+# sinon elle est livrée au bout du budget (avec window.after, sans sleep).
+#
+# Réflexion anticipée (ponder) : pendant que l'humain réfléchit, le thread
+# calcule la réponse de l'IA à chacun de ses coups possibles et la garde,
+# indexée par la position obtenue. Au clic, submit() trouve la réponse déjà
+# prête. La réflexion s'arrête dès qu'un vrai calcul est demandé, au reset,
+# ou quand son budget de temps CPU (ponder_ms) est épuisé.
+#
+# Une erreur pendant un calcul n'arrête pas le thread : la réponse est livrée
+# quand même (coup None) et l'erreur est gardée dans last_error.
+
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class AIWorker:
+    def __init__(self, window, restore, think_ms=250, ponder_ms=2000):
+        # restore : fonction qui recrée un TicTacToe à partir d'une copie figée
+        self.window = window
+        self.restore = restore
+        self.think_ms = think_ms
+        self.ponder_ms = ponder_ms
+        self.generation = 0
+        self.last_compute_ms = 0.0
+        self.last_latency_ms = 0.0
+        self.last_error = None   # erreur du dernier calcul livré, sinon None
+        # Réponses précalculées : copie figée après le coup humain -> coup de l'IA
+        self._replies = {}
+        self._ponder_token = 0
+        self.ponder_hits = 0
+        self.ponder_misses = 0
+        self._jobs = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def new_generation(self):
+        """À appeler au reset : les calculs en cours deviennent périmés."""
+        self.generation += 1
+        self._replies = {}
+
+    def submit(self, snapshot, callback):
+        self._ponder_token += 1   # arrête la réflexion anticipée en cours
+        submitted = time.perf_counter()
+        if snapshot in self._replies:
+            self.ponder_hits += 1
+            self.last_compute_ms = 0.0
+            self._deliver(self.generation, self._replies.pop(snapshot), callback, submitted)
+            return
+        self.ponder_misses += 1
+        self._jobs.put((self.generation, snapshot, callback, submitted))
+
+    def ponder(self, snapshot, human="X"):
+        """Précalcule la réponse à chaque coup possible de human depuis snapshot."""
+        self._ponder_token += 1
+        self._replies = {}
+        self._jobs.put(("ponder", self.generation, self._ponder_token, snapshot, human))
+
+    def stop(self):
+        self._jobs.put(None)
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            if job[0] == "ponder":
+                try:
+                    self._ponder(*job[1:])
+                except Exception:
+                    # Pas grave : le vrai calcul sera fait au clic
+                    logger.exception("réflexion anticipée interrompue")
+                continue
+            generation, snapshot, callback, submitted = job
+            if generation != self.generation:
+                continue  # déjà périmé, inutile de calculer
+            start = time.perf_counter()
+            move, error = None, None
+            try:
+                game = self.restore(snapshot)
+                move = game.ai_move() if game.get_empty_spaces() else None
+            except Exception as exc:
+                logger.exception("calcul de l'IA échoué")
+                error = exc
+            self.last_compute_ms = (time.perf_counter() - start) * 1000
+            self.window.after(0, self._deliver, generation, move, callback, submitted, error)
+
+    def _ponder(self, generation, token, snapshot, human):
+        base = self.restore(snapshot)
+        replies = self._replies
+        start = time.thread_time()
+        for position in base.get_empty_spaces():
+            if (token != self._ponder_token or generation != self.generation
+                    or (time.thread_time() - start) * 1000 > self.ponder_ms):
+                return
+            game = self.restore(snapshot)
+            game.make_move(position, human)
+            if game.check_winner(human) or not game.get_empty_spaces():
+                continue  # partie finie, pas de réponse à préparer
+            replies[game.snapshot()] = game.ai_move()
+
+    def _deliver(self, generation, move, callback, submitted, error=None):
+        # Sur le thread de l'interface
+        if generation != self.generation:
+            return
+        remaining_ms = self.think_ms - (time.perf_counter() - submitted) * 1000
+        if remaining_ms >= 1:
+            self.window.after(int(remaining_ms), self._deliver, generation, move, callback,
+                              submitted, error)
+            return
+        self.last_latency_ms = (time.perf_counter() - submitted) * 1000
+        self.last_error = error
+        callback(move)
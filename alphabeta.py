@@ -0,0 +1,272 @@
+# Minimax avec élagage alpha-bêta, approfondissement itératif et table de transposition.
+#
+# Chaque position est identifiée par un hachage de Zobrist : un nombre
+# aléatoire de 64 bits par (case, joueur), combinés par XOR. Poser ou
+# retirer une pierre ne coûte qu'un XOR, sans relire le plateau.
+#
+# Les résultats sont gardés dans une table de transposition bornée
+# (LRU : l'entrée la moins récemment utilisée est évincée). La table est
+# partagée par toutes les parties du processus et peut être sauvegardée
+# sur disque (persist()) : une position déjà vue ne coûte alors presque rien.
+#
+# Utilisation : game.difficulty = "alphabeta", puis game.ai_move() (voir engine.py).
+
+import atexit
+import math
+import os
+import random
+import struct
+import time
+from collections import OrderedDict
+
+from board import candidate_moves, iter_bits
+
+WIN = 1_000_000
+EXACT, LOWER, UPPER = 0, 1, 2
+
+MAGIC = b"TTTTT1\n"
+ENTRY = struct.Struct(">QiBBH")   # hachage, valeur, profondeur, type, meilleur coup
+NO_MOVE = 0xFFFF
+
+_zobrist = {}
+SIDE_KEY = random.Random(0).getrandbits(64)   # ajouté quand c'est au tour de O
+
+
+def zobrist_keys(n, k):
+    """Clés (X, O) par case; graine fixe pour que les hachages restent valables sur disque."""
+    if (n, k) not in _zobrist:
+        rng = random.Random(n * 1000 + k)
+        cells = n * n
+        _zobrist[(n, k)] = ([rng.getrandbits(64) for _ in range(cells)],
+                            [rng.getrandbits(64) for _ in range(cells)])
+    return _zobrist[(n, k)]
+
+
+def zobrist_hash(board, player):
+    keys_x, keys_o = zobrist_keys(board.n, board.k)
+    h = SIDE_KEY if player == "O" else 0
+    for cell in iter_bits(board.mask_x):
+        h ^= keys_x[cell]
+    for cell in iter_bits(board.mask_o):
+        h ^= keys_o[cell]
+    return h
+
+
+class TranspositionTable:
+    def __init__(self, capacity=200_000):
+        self.capacity = capacity
+        self.entries = OrderedDict()   # hachage -> (valeur, profondeur, type, coup)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, value, depth, flag, move):
+        entries = self.entries
+        old = entries.get(key)
+        if old is not None and old[1] > depth:
+            return  # on garde le résultat le plus profond
+        entries[key] = (value, depth, flag, move)
+        entries.move_to_end(key)
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+
+    def save(self, path):
+        # Écrit dans un fichier temporaire puis remplace : pas de fichier à moitié écrit
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as file:
+            file.write(MAGIC)
+            for key, (value, depth, flag, move) in self.entries.items():
+                file.write(ENTRY.pack(key, value, depth, flag, NO_MOVE if move is None else move))
+        os.replace(tmp, path)
+
+    def load(self, path):
+        with open(path, "rb") as file:
+            data = file.read()
+        if not data.startswith(MAGIC):
+            raise ValueError(f"{path} n'est pas une table de transposition")
+        body = memoryview(data)[len(MAGIC):]
+        body = body[:len(body) - len(body) % ENTRY.size]
+        for key, value, depth, flag, move in ENTRY.iter_unpack(body):
+            self.put(key, value, depth, flag, None if move == NO_MOVE else move)
+
+    def stats(self):
+        return {"entries": len(self.entries), "capacity": self.capacity, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+
+# Table partagée par toutes les parties du processus
+TABLE = TranspositionTable()
+
+
+def persist(path):
+    """Charge la table depuis path (si le fichier existe) et la resauvegarde à la sortie."""
+    if os.path.exists(path):
+        TABLE.load(path)
+    atexit.register(TABLE.save, path)
+
+
+class _Timeout(Exception):
+    pass
+
+
+def _other(player):
+    return "O" if player == "X" else "X"
+
+
+def evaluate(board, player):
+    """Score heuristique pour player : lignes encore gagnables, pondérées par leur remplissage."""
+    if player == "X":
+        mine, theirs = board.count_x, board.count_o
+    else:
+        mine, theirs = board.count_o, board.count_x
+    score = 0
+    for own, other in zip(mine, theirs):
+        if not other:
+            score += 4 ** own - 1 if own else 0
+        elif not own:
+            score -= 4 ** other - 1
+    return score
+
+
+class AlphaBeta:
+    def __init__(self, max_depth=None, time_limit=1.0, table=None):
+        # max_depth None : jusqu'à la fin de la partie sur les petits plateaux, 4 sinon
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.table = TABLE if table is None else table
+        self.nodes = 0
+
+    def _ordered_moves(self, board, player, tt_move):
+        moves = candidate_moves(board)
+        wins = board.winning_cells(player)
+        blocks = board.winning_cells(_other(player))
+        cell_lines = board.geo.cell_lines
+
+        def priority(cell):
+            if cell == tt_move:
+                return 0
+            if wins >> cell & 1:
+                return 1
+            if blocks >> cell & 1:
+                return 2
+            return 3 + 1 / (1 + len(cell_lines[cell]))   # cases sur beaucoup de lignes d'abord
+
+        moves.sort(key=priority)
+        return moves
+
+    def _negamax(self, board, h, depth, alpha, beta, player, ply):
+        self.nodes += 1
+        if self.nodes & 1023 == 0 and time.perf_counter() > self._deadline:
+            raise _Timeout
+
+        alpha_orig = alpha
+        entry = self.table.get(h)
+        tt_move = None
+        if entry is not None:
+            value, entry_depth, flag, tt_move = entry
+            if entry_depth >= depth:
+                # Les victoires sont stockées sans la distance à la racine
+                if value > WIN // 2:
+                    value -= ply
+                elif value < -WIN // 2:
+                    value += ply
+                if flag == EXACT:
+                    return value
+                if flag == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        if not board.empty_mask():
+            return 0
+        if depth == 0:
+            return evaluate(board, player)
+
+        keys = zobrist_keys(board.n, board.k)[0 if player == "X" else 1]
+        best_value = -WIN - 1
+        best_move = None
+        for move in self._ordered_moves(board, player, tt_move):
+            board.place(move, player)
+            if board.is_winner(player):
+                value = WIN - ply - 1
+            else:
+                value = -self._negamax(board, h ^ keys[move] ^ SIDE_KEY, depth - 1,
+                                       -beta, -alpha, _other(player), ply + 1)
+            board.remove(move)
+            if value > best_value:
+                best_value, best_move = value, move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if best_value <= alpha_orig:
+            flag = UPPER
+        elif best_value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        stored = best_value
+        if stored > WIN // 2:
+            stored += ply
+        elif stored < -WIN // 2:
+            stored -= ply
+        self.table.put(h, stored, depth, flag, best_move)
+        return best_value
+
+    def search(self, board, player):
+        """Meilleur coup pour player sur un board.Board; None si le plateau est plein."""
+        empty = board.empty_mask()
+        if not empty:
+            return None
+        work = board.copy()
+        remaining = bin(empty).count("1")
+        max_depth = self.max_depth or (remaining if board.n <= 4 else 4)
+        max_depth = min(max_depth, remaining)
+        h = zobrist_hash(board, player)
+
+        # Table chaude : la position a déjà été résolue à cette profondeur
+        entry = self.table.get(h)
+        if entry is not None and entry[1] >= max_depth and entry[2] == EXACT and entry[3] is not None:
+            return entry[3]
+
+        # time_limit None : pas de limite de temps (résultat reproductible)
+        self._deadline = math.inf if self.time_limit is None else time.perf_counter() + self.time_limit
+        self.nodes = 0
+        best = None
+        for depth in range(1, max_depth + 1):
+            try:
+                self._negamax(work, h, depth, -WIN - 1, WIN + 1, player, 0)
+            except _Timeout:
+                break
+            entry = self.table.get(h)
+            if entry is not None and entry[3] is not None:
+                best = entry[3]
+        if best is None:
+            best = self._ordered_moves(board, player, None)[0]
+        return best
+
+
+_default = None
+
+
+def best_move(game, player="O"):
+    """Stratégie pour TicTacToe.ai_move (difficulté "alphabeta")."""
+    global _default
+    if _default is None:
+        _default = AlphaBeta()
+    return _default.search(game.grid, player)
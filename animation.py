@@ -0,0 +1,114 @@
+# Petites animations Tk sans time.sleep.
+#
+# Une animation est un générateur : chaque `yield` rend la main à Tk et
+# donne le délai (en ms) avant l'étape suivante. Le Scheduler fait avancer
+# toutes les animations depuis un seul window.after par image, donc la
+# fenêtre continue de répondre aux clics et aux messages réseau pendant
+# une animation. Il mesure aussi le retard de la boucle d'événements.
+#
+# Exemple :
+#     scheduler = Scheduler(window)
+#     scheduler.spawn(blink(buttons, "#E74C3C", "#ECF0F1"), tag="victoire")
+#     scheduler.cancel("victoire")
+
+import time
+
+
+class Task:
+    def __init__(self, steps, tag=None, on_done=None):
+        self.steps = steps
+        self.tag = tag
+        self.on_done = on_done
+        self.due = 0.0
+
+
+class Scheduler:
+    def __init__(self, window, frame_ms=16):
+        self.window = window
+        self.frame_ms = frame_ms
+        self.tasks = []
+        self._after_id = None
+        self._expected = 0.0
+        # Statistiques de la boucle d'événements
+        self.frames = 0
+        self.dropped_frames = 0
+        self.max_lag_ms = 0.0
+        self._total_lag_ms = 0.0
+
+    def spawn(self, steps, tag=None, on_done=None):
+        task = Task(steps, tag, on_done)
+        task.due = time.perf_counter()
+        self.tasks.append(task)
+        self._ensure_running()
+        return task
+
+    def cancel(self, tag=None):
+        """Arrête les animations avec ce tag (toutes si tag est None), sans on_done."""
+        for task in list(self.tasks):
+            if tag is None or task.tag == tag:
+                self.tasks.remove(task)
+                task.steps.close()
+        if not self.tasks and self._after_id is not None:
+            self.window.after_cancel(self._after_id)
+            self._after_id = None
+
+    def is_running(self, tag):
+        return any(task.tag == tag for task in self.tasks)
+
+    def _ensure_running(self):
+        # On ne réveille Tk que s'il y a des animations en cours
+        if self._after_id is None:
+            self._expected = time.perf_counter() + self.frame_ms / 1000
+            self._after_id = self.window.after(self.frame_ms, self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        now = time.perf_counter()
+        lag_ms = max(0.0, (now - self._expected) * 1000)
+        self.frames += 1
+        self._total_lag_ms += lag_ms
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        self.dropped_frames += int(lag_ms // self.frame_ms)
+
+        for task in list(self.tasks):
+            if task.due > now or task not in self.tasks:
+                continue
+            try:
+                delay_ms = next(task.steps)
+            except StopIteration:
+                self.tasks.remove(task)
+                if task.on_done is not None:
+                    task.on_done()
+                continue
+            task.due = now + (delay_ms or 0) / 1000
+
+        if self.tasks:
+            self._ensure_running()
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "dropped_frames": self.dropped_frames,
+            "max_lag_ms": round(self.max_lag_ms, 2),
+            "avg_lag_ms": round(self._total_lag_ms / self.frames, 2) if self.frames else 0.0,
+        }
+
+
+def blink(widgets, color, off_color, times=5, interval_ms=200):
+    """Fait clignoter le fond des widgets."""
+    for _ in range(times):
+        for widget in widgets:
+            widget.config(bg=color)
+        yield interval_ms
+        for widget in widgets:
+            widget.config(bg=off_color)
+        yield interval_ms
+
+
+def tween(setter, start, end, step=1, interval_ms=10):
+    """Appelle setter(valeur) de start à end (inclus), une valeur par étape."""
+    value = start
+    while (step > 0 and value <= end) or (step < 0 and value >= end):
+        setter(value)
+        yield interval_ms
+        value += step
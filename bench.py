@@ -0,0 +1,242 @@
+# Banc d'essai du moteur : microbenchmarks et macrobenchmarks, sans interface.
+#
+# Micro : check_winner, get_empty_spaces, make_move, get_strategic_move et
+# ai_move pour chaque difficulté, sur des positions tirées avec une graine
+# fixe. Macro : parties complètes par seconde (self_play, comme --headless)
+# et allers-retours de messages avec NetworkManager vers un serveur écho local.
+#
+# Chaque mesure est répétée; on garde la meilleure (la moins perturbée) et la
+# médiane, en nanosecondes par opération. Les résultats sont écrits en JSON
+# et comparés à une référence : au-delà du seuil, c'est une régression et le
+# programme se termine avec le code 1.
+#
+# Exemple :
+#     python bench.py --save-baseline            # crée bench_baseline.json (propre à la machine, pas versionné)
+#     python bench.py --threshold 0.15           # compare à la référence
+
+import argparse
+import json
+import platform
+import random
+import socket
+import statistics
+import sys
+import threading
+import time
+
+import alphabeta
+from engine import TicTacToe, self_play
+
+DIFFICULTIES = ["facile", "medium", "difficile", "alphabeta"]
+BASELINE_PATH = "bench_baseline.json"
+
+
+def _positions(count, seed=1234):
+    """Parties en cours (ni gagnées ni pleines), toujours les mêmes pour une graine."""
+    rng = random.Random(seed)
+    games = []
+    while len(games) < count:
+        game = TicTacToe()
+        player = "X"
+        for _ in range(rng.randrange(0, 7)):
+            game.make_move(rng.choice(game.get_empty_spaces()), player)
+            if game.check_winner(player):
+                break
+            player = "O" if player == "X" else "X"
+        else:
+            games.append(game)
+    return games
+
+
+def measure(func, ops, repeat):
+    """func() fait `ops` opérations; retourne (meilleur, médiane) en ns par opération."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        func()
+        times.append((time.perf_counter_ns() - start) / ops)
+    return min(times), statistics.median(times)
+
+
+def micro_benchmarks(scale=1):
+    games = _positions(200)
+    loops = 50 * scale
+
+    def check_winner():
+        for _ in range(loops):
+            for game in games:
+                game.check_winner("X")
+                game.check_winner("O")
+
+    def get_empty_spaces():
+        for _ in range(loops):
+            for game in games:
+                game.get_empty_spaces()
+
+    def make_move():
+        game = TicTacToe()
+        for _ in range(loops * 20):
+            for position in range(9):
+                game.make_move(position, "X" if position % 2 else "O")
+            game.reset()
+
+    def get_strategic_move():
+        random.seed(42)
+        for _ in range(loops):
+            for game in games:
+                game.get_strategic_move("O")
+
+    benches = {
+        "check_winner": (check_winner, loops * len(games) * 2),
+        "get_empty_spaces": (get_empty_spaces, loops * len(games)),
+        "make_move": (make_move, loops * 20 * 9),
+        "get_strategic_move": (get_strategic_move, loops * len(games)),
+    }
+    for difficulty in DIFFICULTIES:
+        # alphabeta : table vidée avant chaque coup, sinon on ne mesure que la
+        # réponse déjà en cache pour la racine (quelques µs), pas la recherche
+        # (une vraie recherche par coup : un seul passage sur les positions)
+        if difficulty == "alphabeta":
+            clear, passes = alphabeta.TABLE.clear, scale
+        else:
+            clear, passes = (lambda: None), loops
+
+        def ai_move(difficulty=difficulty, clear=clear, passes=passes):
+            random.seed(42)
+            for _ in range(passes):
+                for game in games:
+                    game.difficulty = difficulty
+                    clear()
+                    game.ai_move("O")
+        benches[f"ai_move[{difficulty}]"] = (ai_move, passes * len(games))
+    return benches
+
+
+class EchoServer:
+    """Renvoie tel quel tout ce qu'il reçoit (un thread par connexion)."""
+
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen()
+        self.port = self.sock.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._echo, args=(conn,), daemon=True).start()
+
+    @staticmethod
+    def _echo(conn):
+        with conn:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            while True:
+                data = conn.recv(65536)
+                if not data:
+                    return
+                conn.sendall(data)
+
+    def close(self):
+        self.sock.close()
+
+
+def macro_benchmarks(scale=1):
+    games = 2000 * scale
+    round_trips = 2000 * scale
+
+    def games_per_second():
+        random.seed(42)
+        self_play(games, "medium", "difficile")
+
+    def network_round_trip():
+        from network import NetworkManager
+
+        server = EchoServer()
+        manager = NetworkManager("127.0.0.1", server.port)
+        manager.connect()
+        manager.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            for position in range(round_trips):
+                manager.send_move(position % 9)
+                if manager.receive_message() is None:
+                    raise RuntimeError("le serveur écho a fermé la connexion")
+        finally:
+            manager.close()
+            server.close()
+
+    return {
+        "self_play_game": (games_per_second, games),
+        "network_round_trip": (network_round_trip, round_trips),
+    }
+
+
+def run(repeat=7, scale=1, only=None):
+    benches = {**micro_benchmarks(scale), **macro_benchmarks(scale)}
+    results = {}
+    for name, (func, ops) in benches.items():
+        if only and not any(word in name for word in only):
+            continue
+        func()  # échauffement (tables du solveur, imports, caches)
+        best, median = measure(func, ops, repeat)
+        results[name] = {"best_ns": round(best, 1), "median_ns": round(median, 1),
+                         "ops_per_s": round(1e9 / best)}
+        print(f"{name:28} {best:12,.0f} ns/op  {1e9 / best:14,.0f} op/s")
+    return {"python": platform.python_version(), "machine": platform.machine(),
+            "time": time.time(), "results": results}
+
+
+def compare(current, baseline, threshold):
+    """Liste des (nom, ancien, nouveau, variation) plus lents que baseline * (1 + threshold)."""
+    regressions = []
+    for name, result in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        change = result["best_ns"] / old["best_ns"] - 1
+        marker = "REGRESSION" if change > threshold else ""
+        print(f"{name:28} {old['best_ns']:12,.0f} -> {result['best_ns']:12,.0f} ns  {change:+7.1%} {marker}")
+        if change > threshold:
+            regressions.append((name, old["best_ns"], result["best_ns"], change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Banc d'essai du moteur TicTacToe")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--scale", type=int, default=1, help="multiplie la taille des mesures")
+    parser.add_argument("--only", nargs="*", help="seulement les mesures dont le nom contient ces mots")
+    parser.add_argument("--out", help="fichier JSON des résultats")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="enregistre les résultats comme référence")
+    parser.add_argument("--threshold", type=float, default=0.10, help="ralentissement toléré (0.10 = 10 %%)")
+    args = parser.parse_args()
+
+    current = run(args.repeat, args.scale, args.only)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as file:
+            json.dump(current, file, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(current, file, indent=2)
+        return 0
+
+    try:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+    except FileNotFoundError:
+        print(f"Pas de référence ({args.baseline}) : lancer avec --save-baseline")
+        return 0
+    print()
+    regressions = compare(current, baseline, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} régression(s) au-delà de {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+# Plateau N x N pour les variantes « k en ligne » (3x3 classique, gomoku 15x15, ...).
+#
+# Chaque joueur a un masque de bits (la case i correspond au bit 1 << i).
+# On précalcule une seule fois, pour chaque taille, toutes les fenêtres de
+# k cases alignées ("lignes") et, pour chaque case, la liste des lignes qui
+# la contiennent. Le plateau garde un compteur de pierres par ligne et par
+# joueur : poser une pierre ne touche que les lignes qui passent par cette
+# case (au plus 4 * k), donc vérifier une victoire coûte O(k) et non O(N²).
+
+from array import array
+
+
+def iter_bits(mask):
+    """Énumère les positions des bits à 1 dans mask, du plus petit au plus grand."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class Geometry:
+    """Tables fixes pour un plateau n x n avec k pierres à aligner."""
+
+    # Directions : horizontale, verticale, diagonale, anti-diagonale
+    DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+    def __init__(self, n, k):
+        if not 1 <= k <= n:
+            raise ValueError(f"k doit être entre 1 et {n}")
+        self.n = n
+        self.k = k
+        self.cells = n * n
+        self.full_mask = (1 << self.cells) - 1
+
+        self.lines = []
+        for dr, dc in self.DIRECTIONS:
+            for row in range(n):
+                for col in range(n):
+                    end_row = row + dr * (k - 1)
+                    end_col = col + dc * (k - 1)
+                    if 0 <= end_row < n and 0 <= end_col < n:
+                        self.lines.append(tuple((row + dr * i) * n + col + dc * i
+                                                for i in range(k)))
+        self.line_masks = tuple(sum(1 << i for i in line) for line in self.lines)
+
+        through = [[] for _ in range(self.cells)]
+        for line_id, line in enumerate(self.lines):
+            for cell in line:
+                through[cell].append(line_id)
+        self.cell_lines = tuple(tuple(ids) for ids in through)
+
+
+_geometries = {}
+
+
+def geometry(n, k):
+    """Retourne la géométrie (partagée) pour un plateau n x n, k en ligne."""
+    key = (n, k)
+    if key not in _geometries:
+        _geometries[key] = Geometry(n, k)
+    return _geometries[key]
+
+
+# Tables du plateau classique 3x3
+WINS = geometry(3, 3).lines
+WIN_MASKS = geometry(3, 3).line_masks
+FULL_MASK = geometry(3, 3).full_mask
+
+
+def has_win(mask):
+    for win in WIN_MASKS:
+        if mask & win == win:
+            return True
+    return False
+
+
+class Board:
+    def __init__(self, n=3, k=3):
+        self.geo = geometry(n, k)
+        self.n = n
+        self.k = k
+        self.reset()
+
+    def reset(self):
+        self.mask_x = 0
+        self.mask_o = 0
+        lines = len(self.geo.lines)
+        self.count_x = array('B', bytes(lines))
+        self.count_o = array('B', bytes(lines))
+        # Nombre de lignes complètes par joueur
+        self.complete_x = 0
+        self.complete_o = 0
+        self.last_move = None
+
+    def copy(self):
+        other = Board.__new__(Board)
+        other.geo = self.geo
+        other.n = self.n
+        other.k = self.k
+        other.mask_x = self.mask_x
+        other.mask_o = self.mask_o
+        other.count_x = array('B', self.count_x)
+        other.count_o = array('B', self.count_o)
+        other.complete_x = self.complete_x
+        other.complete_o = self.complete_o
+        other.last_move = self.last_move
+        return other
+
+    def cell(self, pos):
+        bit = 1 << pos
+        if self.mask_x & bit:
+            return "X"
+        if self.mask_o & bit:
+            return "O"
+        return " "
+
+    def empty_mask(self):
+        return self.geo.full_mask & ~(self.mask_x | self.mask_o)
+
+    def get_empty_spaces(self):
+        return list(iter_bits(self.empty_mask()))
+
+    def to_move(self):
+        """Joueur dont c'est le tour ("X" commence toujours)."""
+        if bin(self.mask_x).count("1") == bin(self.mask_o).count("1"):
+            return "X"
+        return "O"
+
+    def place(self, pos, player):
+        """Pose une pierre; retourne False si la case est occupée."""
+        bit = 1 << pos
+        if (self.mask_x | self.mask_o) & bit:
+            return False
+        k = self.k
+        if player == "X":
+            self.mask_x |= bit
+            counts = self.count_x
+            for line_id in self.geo.cell_lines[pos]:
+                counts[line_id] += 1
+                if counts[line_id] == k:
+                    self.complete_x += 1
+        else:
+            self.mask_o |= bit
+            counts = self.count_o
+            for line_id in self.geo.cell_lines[pos]:
+                counts[line_id] += 1
+                if counts[line_id] == k:
+                    self.complete_o += 1
+        self.last_move = pos
+        return True
+
+    def remove(self, pos):
+        """Retire la pierre en pos (utile pour annuler un coup)."""
+        bit = 1 << pos
+        k = self.k
+        if self.mask_x & bit:
+            self.mask_x &= ~bit
+            counts = self.count_x
+            for line_id in self.geo.cell_lines[pos]:
+                if counts[line_id] == k:
+                    self.complete_x -= 1
+                counts[line_id] -= 1
+        elif self.mask_o & bit:
+            self.mask_o &= ~bit
+            counts = self.count_o
+            for line_id in self.geo.cell_lines[pos]:
+                if counts[line_id] == k:
+                    self.complete_o -= 1
+                counts[line_id] -= 1
+        if self.last_move == pos:
+            self.last_move = None
+
+    def is_winner(self, player):
+        if player == "X":
+            return self.complete_x > 0
+        return self.complete_o > 0
+
+    def winning_line(self):
+        """Cases d'une ligne gagnante, en partant du dernier coup si possible."""
+        candidates = range(len(self.geo.lines))
+        if self.last_move is not None:
+            candidates = list(self.geo.cell_lines[self.last_move]) + list(candidates)
+        k = self.k
+        for line_id in candidates:
+            if self.count_x[line_id] == k or self.count_o[line_id] == k:
+                return self.geo.lines[line_id]
+        return ()
+
+    def winning_cells(self, player):
+        """Masque des cases vides qui donneraient une victoire immédiate à player."""
+        if player == "X":
+            mine, theirs = self.count_x, self.count_o
+        else:
+            mine, theirs = self.count_o, self.count_x
+        need = self.k - 1
+        empty = self.empty_mask()
+        cells = 0
+        for line_id, mask in enumerate(self.geo.line_masks):
+            if mine[line_id] == need and theirs[line_id] == 0:
+                cells |= mask & empty
+        return cells
+
+
+def _neighbor_masks(geo, radius=2):
+    # Pour chaque case, masque des cases à distance <= radius
+    n = geo.n
+    masks = []
+    for cell in range(geo.cells):
+        row, col = divmod(cell, n)
+        mask = 0
+        for r in range(max(0, row - radius), min(n, row + radius + 1)):
+            for c in range(max(0, col - radius), min(n, col + radius + 1)):
+                mask |= 1 << (r * n + c)
+        masks.append(mask)
+    return masks
+
+
+_neighbors = {}
+
+
+def candidate_moves(board):
+    """Cases vides proches des pierres déjà posées (toutes les cases sur un petit plateau)."""
+    empty = board.empty_mask()
+    if board.n <= 4:
+        return list(iter_bits(empty))
+    stones = board.mask_x | board.mask_o
+    if not stones:
+        return [board.geo.cells // 2]
+    key = (board.n, board.k)
+    if key not in _neighbors:
+        _neighbors[key] = _neighbor_masks(board.geo)
+    near = 0
+    for cell in iter_bits(stones):
+        near |= _neighbors[key][cell]
+    return list(iter_bits(near & empty))
@@ -0,0 +1,243 @@
+# Diffusion des parties aux spectateurs (flux en lecture seule, JSON par ligne).
+#
+# Un spectateur se connecte au port des spectateurs du serveur et choisit
+# une partie :
+#
+#   spectateur -> hub : {"type": "watch", "match": 7}
+#   hub -> spectateur : {"type": "matches", "ids": [3, 7]}       (à la connexion)
+#                       {"type": "snapshot", "match": 7, "size": 3, "mask_x": ..., "mask_o": ...,
+#                        "turn": "O", "tail": 2}
+#                       puis les événements de la partie : move, end
+#
+# Chaque événement est encodé une seule fois; les mêmes octets sont écrits
+# sur toutes les connexions. La file de chaque spectateur est le tampon
+# d'écriture de son transport, bornée à QUEUE_LIMIT octets : un spectateur
+# trop lent ne reçoit plus rien (la partie n'attend jamais) et, dès que son
+# tampon est vide, reçoit une nouvelle photo du plateau au lieu des coups
+# manqués. Après STALE_TIMEOUT secondes de retard, il est déconnecté; ces
+# deux vérifications sont aussi faites chaque seconde, même si la partie
+# n'avance plus. L'événement "end" est toujours envoyé, même à un spectateur
+# en retard (précédé d'une photo du plateau final) : quelques octets de plus
+# que la limite, mais personne ne reste sur une partie terminée.
+#
+# Un spectateur qui arrive en cours de partie reçoit une photo du plateau
+# avant les TAIL derniers coups, puis ces coups.
+
+import asyncio
+import logging
+import time
+
+from board import iter_bits
+from codec import CodecError, JsonCodec
+
+logger = logging.getLogger(__name__)
+
+QUEUE_LIMIT = 16 * 1024
+STALE_TIMEOUT = 10.0
+SWEEP_INTERVAL = 1.0
+TAIL = 4
+MAX_MESSAGE = 1024
+
+_codec = JsonCodec()
+
+
+class Spectator:
+    __slots__ = ("writer", "transport", "channel", "stale_since")
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.transport = writer.transport
+        self.channel = None
+        self.stale_since = None   # heure où il a commencé à prendre du retard
+
+
+class Channel:
+    """Une partie diffusée : son historique et ses spectateurs."""
+
+    def __init__(self, match_id, size):
+        self.match_id = match_id
+        self.size = size
+        self.moves = []           # (position, joueur, octets de l'événement)
+        self.spectators = set()
+        self._photo = None        # (nombre de coups, photo encodée)
+
+    def snapshot(self, tail):
+        """Photo du plateau sans les `tail` derniers coups, encodée."""
+        mask_x = mask_o = 0
+        for position, player, _ in self.moves[:len(self.moves) - tail]:
+            if player == "X":
+                mask_x |= 1 << position
+            else:
+                mask_o |= 1 << position
+        turn = "X" if bin(mask_x).count("1") == bin(mask_o).count("1") else "O"
+        return _codec.encode({"type": "snapshot", "match": self.match_id, "size": self.size,
+                              "mask_x": mask_x, "mask_o": mask_o, "turn": turn, "tail": tail})
+
+    def join(self, spectator):
+        tail = min(TAIL, len(self.moves))
+        data = [self.snapshot(tail)]
+        data.extend(event for _, _, event in self.moves[len(self.moves) - tail:])
+        spectator.writer.write(b"".join(data))
+        spectator.channel = self
+        spectator.stale_since = None
+        self.spectators.add(spectator)
+
+    def _current(self):
+        # Photo du plateau actuel, encodée une fois par coup
+        if self._photo is None or self._photo[0] != len(self.moves):
+            self._photo = (len(self.moves), self.snapshot(0))
+        return self._photo[1]
+
+    def _service(self, spectator, now):
+        """Retire les connexions fermées et traite les spectateurs en retard.
+
+        Retourne True si le spectateur est à jour et peut recevoir l'événement suivant.
+        """
+        transport = spectator.transport
+        if transport.is_closing():
+            self.spectators.discard(spectator)
+            return False
+        if spectator.stale_since is None:
+            return True
+        if transport.get_write_buffer_size():
+            if now - spectator.stale_since > STALE_TIMEOUT:
+                logger.info("spectateur trop lent, déconnexion")
+                self.spectators.discard(spectator)
+                transport.close()
+            return False
+        # Tampon vidé : on repart du plateau actuel (qui contient déjà le dernier coup)
+        transport.write(self._current())
+        spectator.stale_since = None
+        return False
+
+    def publish(self, data):
+        now = time.monotonic()
+        for spectator in list(self.spectators):
+            if not self._service(spectator, now):
+                continue
+            transport = spectator.transport
+            if transport.get_write_buffer_size() + len(data) > QUEUE_LIMIT:
+                spectator.stale_since = now
+            else:
+                transport.write(data)
+
+    def sweep(self):
+        """Vérification périodique : rattrapage ou déconnexion sans attendre un nouveau coup."""
+        now = time.monotonic()
+        for spectator in list(self.spectators):
+            self._service(spectator, now)
+
+    def finish(self, data):
+        """Fin de partie : envoyée à tous, même au-delà de QUEUE_LIMIT."""
+        for spectator in self.spectators:
+            transport = spectator.transport
+            if transport.is_closing():
+                continue
+            if spectator.stale_since is not None:
+                transport.write(self._current())
+                spectator.stale_since = None
+            transport.write(data)
+            spectator.channel = None
+        self.spectators.clear()
+
+
+class SpectatorHub:
+    def __init__(self, host="localhost", port=5001):
+        self.host = host
+        self.port = port
+        self.channels = {}
+        self.spectators = set()
+        self._server = None
+        self._sweeper = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle_spectator, self.host, self.port,
+                                                  backlog=4096)
+        self._sweeper = asyncio.create_task(self._sweep_loop())
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("spectateurs sur %s:%s", self.host, self.port)
+        return self._server
+
+    async def _sweep_loop(self):
+        while True:
+            await asyncio.sleep(SWEEP_INTERVAL)
+            for channel in list(self.channels.values()):
+                channel.sweep()
+
+    async def close(self):
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+        if self._server is not None:
+            self._server.close()
+            for spectator in list(self.spectators):
+                spectator.transport.close()
+            await self._server.wait_closed()
+
+    # Appelé par le serveur de jeu
+    def open(self, match_id, size=3):
+        self.channels[match_id] = Channel(match_id, size)
+
+    def publish(self, match_id, message):
+        channel = self.channels.get(match_id)
+        if channel is None:
+            return
+        data = _codec.encode(message)   # une seule fois pour tous les spectateurs
+        if message.get("type") == "move":
+            channel.moves.append((message["position"], message["player"], data))
+        if message.get("type") == "end":
+            channel.finish(data)
+            del self.channels[match_id]
+        else:
+            channel.publish(data)
+
+    def watch(self, spectator, match_id):
+        channel = self.channels.get(match_id)
+        if channel is None:
+            spectator.writer.write(_codec.encode({"type": "error", "reason": "partie inconnue",
+                                                  "match": match_id}))
+            return
+        if spectator.channel is not None:
+            spectator.channel.spectators.discard(spectator)
+        channel.join(spectator)
+
+    async def _handle_spectator(self, reader, writer):
+        spectator = Spectator(writer)
+        self.spectators.add(spectator)
+        writer.write(_codec.encode({"type": "matches", "ids": sorted(self.channels)}))
+        buffer = b""
+        try:
+            while True:
+                data = await reader.read(1024)
+                if not data:
+                    break
+                buffer += data
+                while buffer:
+                    try:
+                        message, buffer = _codec.decode_one(buffer)
+                    except CodecError:
+                        buffer = buffer.split(b"\n", 1)[1]
+                        continue
+                    if message is None:
+                        break
+                    if isinstance(message, dict) and message.get("type") == "watch":
+                        self.watch(spectator, message.get("match"))
+                if len(buffer) > MAX_MESSAGE:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self.spectators.discard(spectator)
+            if spectator.channel is not None:
+                spectator.channel.spectators.discard(spectator)
+            writer.close()
+
+
+def decode_snapshot(message):
+    """Liste de cases (" ", "X", "O") d'un message snapshot."""
+    cells = [" "] * (message["size"] ** 2)
+    for pos in iter_bits(message["mask_x"]):
+        cells[pos] = "X"
+    for pos in iter_bits(message["mask_o"]):
+        cells[pos] = "O"
+    return cells
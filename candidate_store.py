@@ -0,0 +1,689 @@
+# Registre persistant des candidatures, avec index pour la recherche.
+#
+# Un registre est un dossier avec deux fichiers :
+#
+#     candidats.jsonl  journal : une ligne JSON par ajout ({"_id": ..., champs}) ou
+#                      par suppression ({"_supprime": id}); on ne fait qu'y ajouter
+#     index.bin        index du journal jusqu'à un certain octet, lu par mmap
+#
+# L'index contient, en tableaux binaires (ordre natif des octets) :
+#   - par candidat : position dans le journal, âge, date de disponibilité, vivant?
+#   - un index inversé : terme (compétences et poste, en minuscules, sans accents)
+#     -> numéros des candidats, triés
+#   - les candidats triés par âge et par date de disponibilité
+#
+# À l'ouverture, index.bin est projeté en mémoire (mmap) sans rien copier ni
+# décoder : rouvrir un registre d'un million de candidats est presque instantané.
+# Les ajouts et suppressions sont écrits dans le journal tout de suite et
+# gardés en mémoire (delta); save() (appelé par close()) fusionne le delta dans
+# un nouvel index.bin. Si le programme s'arrête avant, la fin du journal est
+# relue à la prochaine ouverture.
+#
+# Une requête comme « python AND sql, disponible d'ici 30 jours » part de la
+# condition la plus sélective (la plus courte liste de l'index) et vérifie les
+# autres sur ses seuls candidats : aucune lecture de tout le registre.
+#
+# Exemple :
+#     python candidate_store.py registre --add candidats.csv
+#     python candidate_store.py registre --query "python AND sql" --within 30 --age-max 40
+#     python candidate_store.py registre --delete 12
+#     python candidate_store.py registre --rebuild     # après une ligne abîmée
+#     python candidate_store.py --bench 1000000
+
+import argparse
+import json
+import mmap
+import os
+import random
+import re
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from itertools import chain
+
+import candidats
+
+MAGIC = b"CANDIX1\n"
+HEADER = struct.Struct("<QIIB7x")   # octets du journal indexés, candidats, termes, boutisme
+SECTION = struct.Struct("<QQ")      # début, longueur (octets)
+# Sections de index.bin, dans l'ordre : (nom, type array)
+SECTIONS = (
+    ("offsets", "Q"),           # position de chaque candidat dans le journal
+    ("ages", "B"),
+    ("available", "i"),         # date de disponibilité (date.toordinal()), 0 = inconnue
+    ("alive", "B"),             # 0 = supprimé
+    ("by_age", "I"),            # candidats vivants triés par âge
+    ("age_keys", "B"),          # leurs âges (même ordre), pour bisect
+    ("by_available", "I"),      # candidats vivants de disponibilité connue, triés par date
+    ("available_keys", "i"),
+    ("term_offsets", "I"),      # nterms + 1 positions dans term_blob
+    ("term_blob", "B"),         # termes triés, en UTF-8, mis bout à bout
+    ("posting_offsets", "I"),   # nterms + 1 positions dans postings
+    ("postings", "I"),          # numéros des candidats de chaque terme, triés
+)
+BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+TOKEN = re.compile(r"[a-z0-9+#]+")
+UNITS = {"jour": 1, "semaine": 7, "mois": 30, "an": 365}
+NUMBERS = {"un": 1, "une": 1, "deux": 2, "trois": 3, "quatre": 4, "cinq": 5, "six": 6}
+WEEKDAYS = ("lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi", "dimanche")
+NOW = ("immediat", "maintenant", "tout de suite", "des que possible", "asap")
+
+
+def _plain(text):
+    # Minuscules sans accents : « Développeur » -> « developpeur »
+    text = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in text if not unicodedata.combining(c))
+
+
+def terms(text):
+    """Termes indexés d'un texte (ordre d'apparition, sans doublons)."""
+    return list(dict.fromkeys(TOKEN.findall(_plain(text))))
+
+
+def parse_availability(text, today=None):
+    """Date de disponibilité d'un texte libre (« immédiate », « dans 2 semaines », 2026-11-02...); None si inconnue."""
+    today = today or date.today()
+    text = _plain(text).strip()
+    if not text:
+        return None
+    if any(word in text for word in NOW):
+        return today
+    if "demain" in text:
+        return today + timedelta(days=1)
+    try:
+        match = re.search(r"(\d{4})-(\d{1,2})-(\d{1,2})", text)
+        if match:
+            return date(*map(int, match.groups()))
+        match = re.search(r"(\d{1,2})/(\d{1,2})/(\d{4})", text)
+        if match:
+            day, month, year = map(int, match.groups())
+            return date(year, month, day)
+    except ValueError:
+        return None
+    match = re.search(r"(\d+|" + "|".join(NUMBERS) + r")\s+(jour|semaine|mois|an)", text)
+    if match:
+        count = NUMBERS.get(match.group(1)) or int(match.group(1))
+        return today + timedelta(days=count * UNITS[match.group(2)])
+    for weekday, name in enumerate(WEEKDAYS):
+        if name in text:
+            return today + timedelta(days=(weekday - today.weekday()) % 7 or 7)
+    return None
+
+
+def parse_query(text):
+    """Clauses d'une requête : liste de (négation, [termes en OU]).
+
+    Les mots sont liés par ET (AND facultatif); « sql OR postgres » forme une
+    seule clause; NOT ou un « - » devant un mot l'exclut.
+    """
+    clauses = []
+    negate = join = False
+    for word in text.replace(",", " ").split():
+        if word == "AND":
+            continue
+        if word == "OR":
+            join = bool(clauses)
+            continue
+        if word == "NOT":
+            negate = True
+            continue
+        if word.startswith("-"):
+            negate, word = True, word[1:]
+        for term in terms(word):
+            if join and clauses[-1][0] == negate:
+                clauses[-1][1].append(term)
+            else:
+                clauses.append((negate, [term]))
+            join = False
+        negate = False
+    return clauses
+
+
+def _contains(ids, value):
+    index = bisect_left(ids, value)
+    return index < len(ids) and ids[index] == value
+
+
+def _rebuild_hint(path):
+    # Commande à lancer, pour les messages d'erreur
+    return f"python candidate_store.py {path or '.'} --rebuild"
+
+
+class _Index:
+    """index.bin projeté en mémoire (ou vide); les sections sont des memoryview typées."""
+
+    def __init__(self, path=None):
+        self._map = None
+        self._views = []
+        self.data_size = self.count = self.nterms = 0
+        for name, code in SECTIONS:
+            setattr(self, name, array(code))
+        self.term_offsets = array("I", [0])
+        self.posting_offsets = array("I", [0])
+        if path is not None and os.path.exists(path):
+            self._open(path)
+
+    def _open(self, path):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._map)
+        self._views.append(view)
+        if bytes(view[:len(MAGIC)]) != MAGIC:
+            self.close()
+            raise ValueError(f"{path} n'est pas un index de candidats")
+        self.data_size, self.count, self.nterms, byte_order = HEADER.unpack_from(view, len(MAGIC))
+        if byte_order != BYTE_ORDER:
+            self.close()
+            raise ValueError(f"{path} vient d'une machine d'un autre boutisme; "
+                             f"le reconstruire ({_rebuild_hint(os.path.dirname(path))})")
+        table = len(MAGIC) + HEADER.size
+        for number, (name, code) in enumerate(SECTIONS):
+            start, length = SECTION.unpack_from(view, table + number * SECTION.size)
+            section = view[start:start + length].cast(code)
+            self._views.append(section)
+            setattr(self, name, section)
+
+    def find(self, term):
+        """Numéro du terme dans l'index (recherche dichotomique), -1 s'il n'y est pas."""
+        key = term.encode()
+        offsets, blob = self.term_offsets, self.term_blob
+        lo, hi = 0, self.nterms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = bytes(blob[offsets[mid]:offsets[mid + 1]])
+            if current < key:
+                lo = mid + 1
+            elif current > key:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def term(self, number):
+        return bytes(self.term_blob[self.term_offsets[number]:self.term_offsets[number + 1]]).decode()
+
+    def postings_of(self, number):
+        return self.postings[self.posting_offsets[number]:self.posting_offsets[number + 1]]
+
+    def close(self):
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+def write_index(path, data_size, count, sections):
+    """Écrit index.bin (sections : dict nom -> array) dans un fichier temporaire puis le remplace."""
+    table = len(MAGIC) + HEADER.size + len(SECTIONS) * SECTION.size
+    position = table
+    layout = []
+    for name, _ in SECTIONS:
+        position += -position % 8   # sections alignées sur 8 octets
+        length = len(sections[name]) * sections[name].itemsize
+        layout.append((position, length))
+        position += length
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as file:
+        file.write(MAGIC)
+        file.write(HEADER.pack(data_size, count, len(sections["term_offsets"]) - 1, BYTE_ORDER))
+        for start, length in layout:
+            file.write(SECTION.pack(start, length))
+        written = table
+        for (name, _), (start, _) in zip(SECTIONS, layout):
+            file.write(bytes(start - written))
+            sections[name].tofile(file)
+            written = start + len(sections[name]) * sections[name].itemsize
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp, path)
+
+
+class CandidateStore:
+    def __init__(self, path, rebuild=False):
+        # rebuild : ignore index.bin et le refait depuis le journal (voir rebuild())
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.data_path = os.path.join(path, "candidats.jsonl")
+        self.index_path = os.path.join(path, "index.bin")
+        self._data = open(self.data_path, "a+b")
+        self.skipped = 0   # lignes illisibles ignorées par rebuild
+        if rebuild:
+            self.base = _Index()
+            self.rebuild()
+        else:
+            self.base = _Index(self.index_path)
+            self._reset_delta()
+            self._replay()
+
+    def _reset_delta(self):
+        # Candidats ajoutés depuis index.bin (numéros base.count, base.count + 1, ...)
+        self._offsets = array("Q")
+        self._ages = array("B")
+        self._available = array("i")
+        self._alive = bytearray()
+        self._postings = {}      # terme -> array("I") trié
+        self._deleted = set()    # candidats de index.bin supprimés depuis
+
+    @property
+    def count(self):
+        """Nombre de numéros attribués (candidats supprimés compris)."""
+        return self.base.count + len(self._ages)
+
+    def __len__(self):
+        return sum(1 for _ in self._alive_ids())
+
+    @property
+    def dirty(self):
+        return bool(self._ages or self._deleted)
+
+    # --- journal ---
+
+    def _replay(self, repair=False):
+        """Relit la fin du journal qui n'est pas encore dans index.bin.
+
+        Seule une dernière ligne sans fin de ligne (écriture interrompue) est
+        retirée. Une ligne illisible au milieu lève ValueError, sauf si repair :
+        elle est alors ignorée et son numéro reste vide (candidat supprimé).
+        """
+        self._data.seek(0, os.SEEK_END)
+        end = self._data.tell()
+        if end < self.base.data_size:
+            raise ValueError(f"{self.data_path} est plus court que son index; "
+                             f"le reconstruire ({_rebuild_hint(self.path)})")
+        self._data.seek(self.base.data_size)
+        offset = self.base.data_size
+        for line in self._data:
+            try:
+                entry = json.loads(line) if line.endswith(b"\n") else None
+            except ValueError:
+                entry = None
+            if entry is None:
+                if line.endswith(b"\n"):
+                    # Ligne complète mais illisible : on ne retire rien, les suivantes sont peut-être bonnes
+                    if not repair:
+                        raise ValueError(f"{self.data_path} : ligne illisible à l'octet {offset}; "
+                                         f"la corriger ou reconstruire l'index ({_rebuild_hint(self.path)})")
+                    self.skipped += 1
+                    offset += len(line)
+                    continue
+                # Dernière ligne à moitié écrite (arrêt brutal) : on la retire
+                self._data.truncate(offset)
+                break
+            if "_supprime" in entry:
+                self._forget(entry["_supprime"])
+            else:
+                while repair and isinstance(entry.get("_id"), int) and entry["_id"] > self.count:
+                    self._index_hole()   # ajout perdu dans une ligne illisible
+                if entry.get("_id") != self.count:
+                    raise ValueError(f"{self.data_path} : numéro {entry.get('_id')} inattendu à l'octet {offset}")
+                self._index_new(entry, offset)
+            offset += len(line)
+        self._data.seek(0, os.SEEK_END)
+
+    def _append(self, entry):
+        self._data.seek(0, os.SEEK_END)
+        offset = self._data.tell()
+        self._data.write(json.dumps(entry, ensure_ascii=False).encode() + b"\n")
+        self._data.flush()   # ligne complète dans le fichier tout de suite (relue si on s'arrête avant save())
+        return offset
+
+    def flush(self):
+        self._data.flush()
+
+    # --- mises à jour ---
+
+    def add(self, record, today=None):
+        """Ajoute une candidature (champs du formulaire); retourne son numéro."""
+        record = candidats.clean(record)
+        available = parse_availability(record["disponibilite"], today)
+        entry = {"_id": self.count, "_disponible": available.isoformat() if available else None}
+        entry.update(record)
+        self._index_new(entry, self._append(entry))
+        return entry["_id"]
+
+    def _index_new(self, entry, offset):
+        number = self.count
+        available = entry.get("_disponible")
+        self._offsets.append(offset)
+        self._ages.append(entry["age"])
+        self._available.append(date.fromisoformat(available).toordinal() if available else 0)
+        self._alive.append(1)
+        for term in terms(f"{entry['competences']} {entry['poste']}"):
+            self._postings.setdefault(term, array("I")).append(number)
+
+    def _index_hole(self):
+        self._offsets.append(0)
+        self._ages.append(0)
+        self._available.append(0)
+        self._alive.append(0)
+
+    def delete(self, number):
+        """Supprime un candidat; False s'il n'existe pas (ou plus)."""
+        if not 0 <= number < self.count or not self.is_alive(number):
+            return False
+        self._append({"_supprime": number})
+        self._forget(number)
+        return True
+
+    def update(self, number, record, today=None):
+        """Remplace un candidat; retourne son nouveau numéro."""
+        if not self.delete(number):
+            raise KeyError(number)
+        return self.add(record, today)
+
+    def _forget(self, number):
+        if number < self.base.count:
+            self._deleted.add(number)
+        else:
+            self._alive[number - self.base.count] = 0
+
+    # --- colonnes ---
+
+    def is_alive(self, number):
+        base = self.base
+        if number < base.count:
+            return base.alive[number] == 1 and number not in self._deleted
+        return self._alive[number - base.count] == 1
+
+    def age(self, number):
+        base = self.base
+        return base.ages[number] if number < base.count else self._ages[number - base.count]
+
+    def available_on(self, number):
+        """Date de disponibilité (ordinal), 0 si inconnue."""
+        base = self.base
+        return base.available[number] if number < base.count else self._available[number - base.count]
+
+    def _alive_ids(self):
+        return (number for number in range(self.count) if self.is_alive(number))
+
+    def get(self, number):
+        """La candidature telle qu'enregistrée, avec son numéro (clé "id")."""
+        if not 0 <= number < self.count or not self.is_alive(number):
+            raise KeyError(number)
+        base = self.base
+        offset = base.offsets[number] if number < base.count else self._offsets[number - base.count]
+        self._data.flush()
+        self._data.seek(offset)
+        entry = json.loads(self._data.readline())
+        self._data.seek(0, os.SEEK_END)
+        record = {"id": entry["_id"]}
+        record.update((key, value) for key, value in entry.items() if not key.startswith("_"))
+        return record
+
+    # --- requêtes ---
+
+    def postings(self, term):
+        """Listes triées des candidats d'un terme : (partie de index.bin, partie du delta)."""
+        parts = []
+        number = self.base.find(term)
+        if number >= 0:
+            parts.append(self.base.postings_of(number))
+        if term in self._postings:
+            parts.append(self._postings[term])
+        return parts
+
+    def _range(self, keys, ids, column, lo, hi):
+        # (taille estimée, candidats, test) pour lo <= colonne <= hi
+        start, stop = bisect_left(keys, lo), bisect_right(keys, hi)
+        delta = range(self.base.count, self.count)
+
+        def members():
+            yield from ids[start:stop]
+            yield from (n for n in delta if lo <= column(n) <= hi)
+
+        return stop - start + len(delta), members, lambda n: lo <= column(n) <= hi
+
+    def query(self, text="", age_min=None, age_max=None, within=None, available_by=None, today=None):
+        """Numéros des candidats (triés) qui satisfont la requête.
+
+        text : termes liés par ET (voir parse_query); age_min/age_max : bornes
+        incluses; within : disponible d'ici ce nombre de jours (ou available_by, une date).
+        """
+        base = self.base
+        predicates = []    # (taille estimée, générateur des candidats, test d'appartenance)
+        excluded = []
+        for negate, clause in parse_query(text):
+            parts = [part for term in clause for part in self.postings(term)]
+            test = (lambda n, parts=parts: any(_contains(part, n) for part in parts))
+            if negate:
+                excluded.append(test)
+                continue
+            if len(clause) == 1:
+                members = (lambda parts=parts: chain(*parts))
+            else:
+                members = (lambda parts=parts: sorted(set(chain(*parts))))
+            predicates.append((sum(map(len, parts)), members, test))
+        if age_min is not None or age_max is not None:
+            predicates.append(self._range(base.age_keys, base.by_age, self.age,
+                                          0 if age_min is None else age_min,
+                                          255 if age_max is None else age_max))
+        if within is not None:
+            available_by = (today or date.today()) + timedelta(days=within)
+        if available_by is not None:
+            predicates.append(self._range(base.available_keys, base.by_available, self.available_on,
+                                          1, available_by.toordinal()))
+
+        if not predicates:
+            candidates = set(self._alive_ids())
+        else:
+            # La condition la plus sélective fournit les candidats; les autres les réduisent :
+            # intersection d'ensembles si leur liste est du même ordre de taille, sinon test un par un
+            predicates.sort(key=lambda predicate: predicate[0])
+            candidates = set(predicates[0][1]())
+            for size, members, test in predicates[1:]:
+                if not candidates:
+                    break
+                if size <= 4 * len(candidates):
+                    candidates.intersection_update(members())
+                else:
+                    candidates = {n for n in candidates if test(n)}
+        is_alive = self.is_alive
+        return sorted(n for n in candidates
+                      if is_alive(n) and not any(test(n) for test in excluded))
+
+    def search(self, *args, **kwargs):
+        """Comme query(), mais retourne les candidatures."""
+        return [self.get(number) for number in self.query(*args, **kwargs)]
+
+    # --- index sur disque ---
+
+    def save(self):
+        """Fusionne les mises à jour dans un nouvel index.bin."""
+        self._data.flush()
+        os.fsync(self._data.fileno())
+        if not self.dirty and os.path.exists(self.index_path):
+            return
+        base = self.base
+        count = self.count
+        ages = array("B", base.ages)
+        ages.extend(self._ages)
+        available = array("i", base.available)
+        available.extend(self._available)
+        offsets = array("Q", base.offsets)
+        offsets.extend(self._offsets)
+        alive = bytearray(base.alive)
+        alive.extend(self._alive)
+        for number in self._deleted:
+            alive[number] = 0
+        deleted = bool(self._deleted) or 0 in self._alive
+
+        by_age = array("I", sorted((n for n in range(count) if alive[n]), key=ages.__getitem__))
+        by_available = array("I", sorted((n for n in range(count) if alive[n] and available[n]),
+                                         key=available.__getitem__))
+        sections = {
+            "offsets": offsets, "ages": ages, "available": available, "alive": array("B", alive),
+            "by_age": by_age, "age_keys": array("B", map(ages.__getitem__, by_age)),
+            "by_available": by_available,
+            "available_keys": array("i", map(available.__getitem__, by_available)),
+            "term_offsets": array("I", [0]), "term_blob": array("B"),
+            "posting_offsets": array("I", [0]), "postings": array("I"),
+        }
+        # Fusion des deux index inversés, termes dans l'ordre (comparaison des octets UTF-8)
+        names = {base.term(number): number for number in range(base.nterms)}
+        for term in sorted(names.keys() | self._postings.keys(), key=str.encode):
+            ids = array("I")
+            if term in names:
+                ids.extend(base.postings_of(names[term]))
+            ids.extend(self._postings.get(term, ()))
+            if deleted:
+                ids = array("I", (n for n in ids if alive[n]))
+            if not ids:
+                continue
+            sections["term_blob"].frombytes(term.encode())
+            sections["term_offsets"].append(len(sections["term_blob"]))
+            sections["postings"].extend(ids)
+            sections["posting_offsets"].append(len(sections["postings"]))
+
+        data_size = os.path.getsize(self.data_path)
+        base.close()   # index.bin ne doit plus être projeté quand on le remplace
+        write_index(self.index_path, data_size, count, sections)
+        self.base = _Index(self.index_path)
+        self._reset_delta()
+
+    def rebuild(self):
+        """Reconstruit index.bin depuis tout le journal, en ignorant les lignes illisibles."""
+        self.base.close()
+        if os.path.exists(self.index_path):
+            os.remove(self.index_path)
+        self.base = _Index()
+        self._reset_delta()
+        self.skipped = 0
+        self._replay(repair=True)
+        self.save()
+
+    def close(self):
+        if self._data.closed:
+            return
+        self.save()
+        self.base.close()
+        self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+SKILLS = ["python", "sql", "java", "javascript", "c++", "c#", "excel", "linux", "docker", "git",
+          "react", "php", "rust", "go", "r", "tableau", "communication", "anglais", "espagnol",
+          "gestion", "vente", "comptabilité", "photoshop", "autocad", "réseaux", "sécurité",
+          "leadership", "marketing", "soudure", "électricité"]
+POSTES = ["développeur", "analyste", "technicien", "designer", "gestionnaire", "comptable",
+          "vendeur", "électricien", "administrateur système", "chargé de projet"]
+DISPONIBILITES = ["immédiate", "dans 2 semaines", "dans un mois", "dans 3 mois", "dans 6 mois",
+                  "demain", "lundi", "dès que possible", "à discuter"]
+
+
+def synthetic_records(count, seed=1):
+    rng = random.Random(seed)
+    for i in range(count):
+        yield {"nom": f"Candidat {i}", "age": rng.randint(18, 65), "poste": rng.choice(POSTES),
+               "experience": f"{rng.randint(0, 30)} ans",
+               "competences": ", ".join(rng.sample(SKILLS, rng.randint(2, 6))),
+               "disponibilite": rng.choice(DISPONIBILITES)}
+
+
+def _scan(store, query_terms, age_max, available_by):
+    # Lecture de tout le journal, pour comparer avec l'index
+    found = []
+    for number in range(store.count):
+        if not store.is_alive(number):
+            continue
+        record = store.get(number)
+        words = set(terms(f"{record['competences']} {record['poste']}"))
+        available = parse_availability(record["disponibilite"])
+        if (all(term in words for term in query_terms) and record["age"] <= age_max
+                and available is not None and available <= available_by):
+            found.append(number)
+    return found
+
+
+def benchmark(count, query="python AND sql", within=30, age_max=40):
+    """Construction, réouverture et requête (index contre lecture complète) sur count candidats."""
+    path = tempfile.mkdtemp(prefix="candidats-")
+    try:
+        start = time.perf_counter()
+        with CandidateStore(path) as store:
+            for record in synthetic_records(count):
+                store.add(record)
+            added = time.perf_counter()
+        built = time.perf_counter()
+
+        start_open = time.perf_counter()
+        store = CandidateStore(path)
+        opened = time.perf_counter()
+        result = store.query(query, age_max=age_max, within=within)
+        queried = time.perf_counter()
+        available_by = date.today() + timedelta(days=within)
+        scanned = _scan(store, [t for _, clause in parse_query(query) for t in clause], age_max, available_by)
+        scan_end = time.perf_counter()
+        store.close()
+        if scanned != result:
+            raise AssertionError("l'index et la lecture complète ne donnent pas le même résultat")
+        return {"candidates": count, "matches": len(result),
+                "add_s": added - start, "save_s": built - added, "open_ms": (opened - start_open) * 1000,
+                "query_ms": (queried - opened) * 1000, "scan_ms": (scan_end - queried) * 1000,
+                "index_bytes": os.path.getsize(os.path.join(path, "index.bin")),
+                "journal_bytes": os.path.getsize(os.path.join(path, "candidats.jsonl"))}
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Registre des candidatures et recherche par index")
+    parser.add_argument("path", nargs="?", help="dossier du registre")
+    parser.add_argument("--add", nargs="+", metavar="FICHIER", help="candidatures CSV/JSONL à ajouter ('-' = entrée standard)")
+    parser.add_argument("--format", choices=sorted(candidats.READERS))
+    parser.add_argument("--delete", nargs="+", type=int, metavar="ID")
+    parser.add_argument("--query", metavar="TEXTE", help='ex. "python AND sql NOT php"')
+    parser.add_argument("--age-min", type=int)
+    parser.add_argument("--age-max", type=int)
+    parser.add_argument("--within", type=int, metavar="JOURS", help="disponible d'ici JOURS jours")
+    parser.add_argument("--limit", type=int, default=20, help="résumés affichés au plus")
+    parser.add_argument("--rebuild", action="store_true", help="reconstruit l'index depuis le journal")
+    parser.add_argument("--bench", type=int, metavar="N", help="mesure sur N candidats générés")
+    args = parser.parse_args()
+
+    if args.bench:
+        print(json.dumps(benchmark(args.bench), indent=2))
+        return
+    if not args.path:
+        parser.error("le dossier du registre est requis")
+
+    with CandidateStore(args.path, rebuild=args.rebuild) as store:
+        if store.skipped:
+            print(f"{store.skipped} lignes illisibles ignorées dans le journal", file=sys.stderr)
+        if args.add:
+            errors = candidats.ErrorLog()
+            added = 0
+            for path in args.add:
+                for record in candidats.validate(candidats.read_records(path, args.format), errors):
+                    store.add(record)
+                    added += 1
+            print(f"{added} candidats ajoutés, {errors.count} candidatures invalides", file=sys.stderr)
+        for number in args.delete or ():
+            if not store.delete(number):
+                print(f"candidat {number} introuvable", file=sys.stderr)
+        if args.query is not None or args.age_min is not None or args.age_max is not None or args.within is not None:
+            start = time.perf_counter()
+            found = store.query(args.query or "", args.age_min, args.age_max, args.within)
+            elapsed = (time.perf_counter() - start) * 1000
+            for number in found[:args.limit]:
+                record = store.get(number)
+                print(f"#{number}")
+                sys.stdout.write(candidats.render(record))
+            print(f"{len(found)} candidats trouvés en {elapsed:.1f} ms", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
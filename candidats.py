@@ -0,0 +1,191 @@
+# Traitement en lot des candidatures du formulaire de résumé d'embauche.
+#
+# Les candidatures arrivent d'un fichier CSV (une ligne d'en-tête avec les
+# noms des champs) ou JSONL (un objet JSON par ligne), ou de l'entrée
+# standard. Tout passe par une chaîne de générateurs :
+#
+#     lecture -> validation -> résumé -> écriture par blocs
+#
+# Une seule candidature est en mémoire à la fois : un fichier de millions de
+# candidats est traité en mémoire constante. Les résumés sont regroupés en
+# blocs d'environ 64 Kio avant chaque écriture.
+#
+# Exemple :
+#     python "# Formulaire pour un résumé d'embauche.py" --batch candidats.csv --out resumes.txt
+
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+
+FIELDS = ["nom", "age", "poste", "experience", "competences", "disponibilite"]
+LABELS = {
+    "nom": "Nom complet",
+    "age": "Âge",
+    "poste": "Poste souhaité",
+    "experience": "Expérience professionnelle",
+    "competences": "Compétences clés",
+    "disponibilite": "Disponibilité pour commencer",
+}
+AGE_MIN, AGE_MAX = 14, 100
+BUFFER_SIZE = 64 * 1024
+
+
+class InvalidRecord(ValueError):
+    pass
+
+
+def read_csv(stream):
+    for record in csv.DictReader(stream):
+        yield record
+
+
+def read_jsonl(stream):
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            yield None   # ligne illisible, comptée comme invalide par validate()
+            continue
+        yield record if isinstance(record, dict) else None
+
+
+READERS = {"csv": read_csv, "jsonl": read_jsonl}
+
+
+def guess_format(path):
+    return "jsonl" if path.endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+
+def read_records(path, fmt=None):
+    """Candidatures d'un fichier ("-" = entrée standard), une à la fois."""
+    if path == "-":
+        yield from READERS[fmt or "csv"](sys.stdin)
+        return
+    with open(path, encoding="utf-8", newline="") as stream:
+        yield from READERS[fmt or guess_format(path)](stream)
+
+
+def clean(record):
+    """Candidature nettoyée (champs texte sans espaces autour, âge entier); InvalidRecord sinon."""
+    if record is None:
+        raise InvalidRecord("ligne illisible")
+    result = {}
+    for field in FIELDS:
+        value = record.get(field)
+        result[field] = "" if value is None else str(value).strip()
+    if not result["nom"]:
+        raise InvalidRecord("nom manquant")
+    try:
+        age = int(result["age"])
+    except ValueError:
+        raise InvalidRecord(f"âge invalide: {result['age']!r}") from None
+    if not AGE_MIN <= age <= AGE_MAX:
+        raise InvalidRecord(f"âge hors limites: {age}")
+    result["age"] = age
+    return result
+
+
+def validate(records, errors=None):
+    """Garde les candidatures valides; les autres vont dans errors (numéro, raison)."""
+    for number, record in enumerate(records, 1):
+        try:
+            yield clean(record)
+        except InvalidRecord as error:
+            if errors is not None:
+                errors.append((number, str(error)))
+
+
+def render(record):
+    """Résumé d'une candidature, comme dans le formulaire interactif."""
+    return "".join(f"{LABELS[field]}: {record[field]}\n" for field in FIELDS) + "\n"
+
+
+def write_buffered(chunks, out, buffer_size=BUFFER_SIZE):
+    """Écrit les morceaux de texte par blocs; retourne le nombre de morceaux."""
+    block = []
+    size = 0
+    count = 0
+    for chunk in chunks:
+        block.append(chunk)
+        size += len(chunk)
+        count += 1
+        if size >= buffer_size:
+            out.write("".join(block))
+            block = []
+            size = 0
+    if block:
+        out.write("".join(block))
+    out.flush()
+    return count
+
+
+class ErrorLog:
+    # Garde le nombre d'erreurs et seulement les premières (mémoire constante)
+    def __init__(self, keep=20):
+        self.keep = keep
+        self.count = 0
+        self.first = []
+
+    def append(self, error):
+        self.count += 1
+        if len(self.first) < self.keep:
+            self.first.append(error)
+
+
+def run_batch(paths, out, fmt=None, sink=None):
+    """Traite les fichiers; retourne (résumés écrits, ErrorLog).
+
+    sink(record), si donné, reçoit aussi chaque candidature valide (ex. CandidateStore.add).
+    """
+    errors = ErrorLog()
+
+    def records():
+        for path in paths:
+            yield from read_records(path, fmt)
+
+    def summaries():
+        for record in validate(records(), errors):
+            if sink is not None:
+                sink(record)
+            yield render(record)
+
+    written = write_buffered(summaries(), out)
+    return written, errors
+
+
+def synthetic_records(count):
+    postes = ["développeur", "analyste", "technicien", "designer", "gestionnaire"]
+    for i in range(count):
+        yield {"nom": f"Candidat {i}", "age": str(18 + i % 50), "poste": postes[i % len(postes)],
+               "experience": f"{i % 15} ans", "competences": "python, sql, communication",
+               "disponibilite": "immédiate" if i % 3 else "dans un mois"}
+
+
+def benchmark(count=200_000):
+    """Candidatures par seconde, CSV et JSONL, d'un fichier temporaire vers os.devnull."""
+    results = {}
+    for fmt in ("csv", "jsonl"):
+        fd, path = tempfile.mkstemp(suffix="." + fmt)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as stream:
+                if fmt == "csv":
+                    writer = csv.DictWriter(stream, FIELDS)
+                    writer.writeheader()
+                    writer.writerows(synthetic_records(count))
+                else:
+                    write_buffered((json.dumps(r, ensure_ascii=False) + "\n"
+                                    for r in synthetic_records(count)), stream)
+            with open(os.devnull, "w", encoding="utf-8") as out:
+                start = time.perf_counter()
+                written, _ = run_batch([path], out)
+                elapsed = time.perf_counter() - start
+            results[fmt] = written / elapsed
+        finally:
+            os.remove(path)
+    return results
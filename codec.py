@@ -0,0 +1,190 @@
+# Formats des messages réseau : JSON (une ligne par message) ou binaire compact.
+#
+# Les deux codecs ont la même interface :
+#     codec.encode(message)       -> bytes à envoyer
+#     codec.decode_one(buffer)    -> (message ou None, reste du tampon)
+#
+# Le format binaire est négocié au début de la connexion : le client envoie
+# {"type": "hello", "formats": ["binary", "json"]} en JSON, le serveur répond
+# {"type": "hello", "format": "binary"} en JSON, puis les deux côtés passent
+# au binaire. Sans négociation, tout reste en JSON (pratique pour déboguer).
+#
+# Trame binaire :
+#     longueur H | type B | partie I | séquence I | horodatage Q (µs) | contenu
+# Contenu selon le type :
+#     move  : position H, joueur B     ack   : position H
+#     start : symbole B                end   : gagnant B, raison B
+#     error : raison en UTF-8          waiting / hello : rien
+#
+# Exemple (banc d'essai) :
+#     python codec.py
+
+import json
+import struct
+import time
+
+HEADER = struct.Struct(">HBIIQ")
+LENGTH = struct.Struct(">H")
+MOVE = struct.Struct(">HB")
+ACK = struct.Struct(">H")
+START = struct.Struct(">B")
+END = struct.Struct(">BB")
+
+TYPES = ["waiting", "hello", "start", "move", "ack", "end", "error"]
+TYPE_CODES = {name: code for code, name in enumerate(TYPES, 1)}
+SYMBOLS = [None, "X", "O"]
+SYMBOL_CODES = {symbol: code for code, symbol in enumerate(SYMBOLS)}
+REASONS = ["", "victoire", "nul", "timeout", "déconnexion", "arrêt du serveur"]
+REASON_CODES = {reason: code for code, reason in enumerate(REASONS)}
+
+
+class CodecError(ValueError):
+    pass
+
+
+class JsonCodec:
+    name = "json"
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+
+    def encode(self, message):
+        return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+    def decode_one(self, buffer):
+        buffer = buffer.lstrip()
+        if not buffer:
+            return None, b""
+        newline = buffer.find(b"\n")
+        chunk = buffer if newline < 0 else buffer[:newline]
+        text = chunk.decode(errors="replace")
+        try:
+            message, end = self._decoder.raw_decode(text)
+        except json.JSONDecodeError:
+            if newline < 0:
+                return None, buffer  # message incomplet
+            raise CodecError("JSON invalide")
+        rest = buffer[len(text[:end].encode()):]
+        if newline >= 0 and not text[end:].strip():
+            # Fin de ligne : on consomme aussi le saut de ligne, pour que la suite
+            # du tampon soit propre si le format change (voir hello)
+            return message, buffer[newline + 1:]
+        # Plusieurs objets collés sur une même ligne (ancien NetworkManager)
+        return message, rest
+
+
+class BinaryCodec:
+    name = "binary"
+
+    def encode(self, message):
+        kind = message["type"]
+        code = TYPE_CODES[kind]
+        if kind == "move":
+            body = MOVE.pack(message["position"], SYMBOL_CODES[message.get("player")])
+        elif kind == "ack":
+            body = ACK.pack(message["position"])
+        elif kind == "start":
+            body = START.pack(SYMBOL_CODES[message["symbol"]])
+        elif kind == "end":
+            body = END.pack(SYMBOL_CODES[message.get("winner")],
+                            REASON_CODES.get(message.get("reason", ""), 0))
+        elif kind == "error":
+            body = message.get("reason", "").encode()
+        else:
+            body = b""
+        timestamp = int(message.get("timestamp", 0) * 1_000_000)
+        size = HEADER.size - LENGTH.size + len(body)
+        return HEADER.pack(size, code, message.get("match", 0),
+                           message.get("seq", 0), timestamp) + body
+
+    def decode_one(self, buffer):
+        if len(buffer) < LENGTH.size:
+            return None, buffer
+        (size,) = LENGTH.unpack_from(buffer)
+        end = LENGTH.size + size
+        if len(buffer) < end:
+            return None, buffer
+        if size < HEADER.size - LENGTH.size:
+            raise CodecError("trame trop courte")
+        _, code, match, seq, timestamp = HEADER.unpack_from(buffer)
+        body = buffer[HEADER.size:end]
+        if not 1 <= code <= len(TYPES):
+            raise CodecError(f"type inconnu: {code}")
+        kind = TYPES[code - 1]
+        message = {"type": kind}
+        try:
+            if kind == "move":
+                position, player = MOVE.unpack(body)
+                message["position"] = position
+                message["player"] = SYMBOLS[player]
+            elif kind == "ack":
+                (message["position"],) = ACK.unpack(body)
+            elif kind == "start":
+                (symbol,) = START.unpack(body)
+                message["symbol"] = SYMBOLS[symbol]
+            elif kind == "end":
+                winner, reason = END.unpack(body)
+                message["winner"] = SYMBOLS[winner]
+                message["reason"] = REASONS[reason] if reason < len(REASONS) else ""
+            elif kind == "error":
+                message["reason"] = body.decode(errors="replace")
+        except (struct.error, IndexError):
+            raise CodecError(f"contenu invalide pour {kind}")
+        if match:
+            message["match"] = match
+        if seq:
+            message["seq"] = seq
+        if timestamp:
+            message["timestamp"] = timestamp / 1_000_000
+        return message, buffer[end:]
+
+
+CODECS = {"json": JsonCodec, "binary": BinaryCodec}
+
+
+def hello_message(formats=("binary", "json")):
+    return {"type": "hello", "formats": list(formats)}
+
+
+def choose_format(hello):
+    """Côté serveur : premier format proposé par le client qu'on sait lire ("json" par défaut)."""
+    formats = hello.get("formats")
+    if not isinstance(formats, list):
+        return "json"   # absent, null, nombre... : message mal formé
+    for name in formats:
+        if isinstance(name, str) and name in CODECS:
+            return name
+    return "json"
+
+
+def benchmark(count=200_000):
+    message = {"type": "move", "position": 4, "player": "X",
+               "match": 1234, "seq": 17, "timestamp": time.time()}
+    results = {}
+    for name, codec_class in CODECS.items():
+        codec = codec_class()
+        start = time.perf_counter()
+        for _ in range(count):
+            data = codec.encode(message)
+        encode_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(count):
+            codec.decode_one(data)
+        decode_time = time.perf_counter() - start
+        results[name] = {
+            "bytes": len(data),
+            "encode_us": encode_time / count * 1e6,
+            "decode_us": decode_time / count * 1e6,
+        }
+    return results
+
+
+def main():
+    for name, result in benchmark().items():
+        print(f"{name:7} {result['bytes']:3} octets  "
+              f"encodage {result['encode_us']:.2f} µs  "
+              f"décodage {result['decode_us']:.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Affichage du jeu dans le terminal, sans scintillement.
+#
+# Le ConsoleRenderer garde le dernier plateau affiché. Au premier dessin (ou
+# si la taille change), l'écran est effacé et le plateau entier est dessiné;
+# ensuite, seules les cases modifiées sont réécrites en déplaçant le curseur
+# avec des séquences ANSI. Chaque image part en une seule écriture (un seul
+# write + flush), ce qui compte beaucoup à travers SSH.
+#
+# Si la sortie n'est pas un terminal (fichier, tube, TERM=dumb), le plateau
+# est simplement réécrit en texte brut, sans couleurs ni séquences ANSI
+# (les invites de saisie aussi, avec ask()).
+# Fonctionne pour n'importe quelle taille N x N.
+
+import os
+import re
+import sys
+
+from engine import Colors
+
+CSI = "\033["
+CELL_COLORS = {"X": Colors.RED, "O": Colors.GREEN}
+ANSI_CODE = re.compile(r"\033\[[0-9;]*[A-Za-z]")
+
+
+def _is_terminal(stream):
+    return (hasattr(stream, "isatty") and stream.isatty()
+            and os.environ.get("TERM") != "dumb")
+
+
+class ConsoleRenderer:
+    def __init__(self, stream=None, ansi=None):
+        self.stream = stream or sys.stdout
+        self.ansi = _is_terminal(self.stream) if ansi is None else ansi
+        self.previous = None   # cases affichées à l'écran, None si l'écran a changé
+        self.size = None
+        self.writes = 0
+
+    def _write(self, text):
+        if not self.ansi:
+            text = ANSI_CODE.sub("", text)   # couleurs des messages retirées aussi
+        self.stream.write(text)
+        self.stream.flush()
+        self.writes += 1
+
+    def _cell(self, value):
+        if self.ansi and value in CELL_COLORS:
+            return f"{CELL_COLORS[value]}{value}{Colors.BLUE}"
+        return value
+
+    def _board_text(self, cells, size):
+        # Même dessin que TicTacToe.display_board
+        lines = ["╔" + "╦".join(["═══"] * size) + "╗"]
+        for row in range(size):
+            values = [self._cell(cells[row * size + col]) for col in range(size)]
+            lines.append("║ " + " ║ ".join(values) + " ║")
+            if row < size - 1:
+                lines.append("╠" + "╬".join(["═══"] * size) + "╣")
+        lines.append("╚" + "╩".join(["═══"] * size) + "╝")
+        if self.ansi:
+            return Colors.BLUE + "\n".join(lines) + Colors.ENDC + "\n"
+        return "\n".join(lines) + "\n"
+
+    def _status_row(self):
+        # Première ligne sous le plateau (plateau dessiné à partir de la ligne 1)
+        return 2 * self.size + 2
+
+    def draw(self, cells, size, status=""):
+        """Affiche le plateau (liste de " ", "X", "O") et un texte en dessous."""
+        cells = list(cells)
+        out = []
+        if not self.ansi:
+            out.append("\n" + self._board_text(cells, size))
+            if status:
+                out.append(status + "\n")
+        else:
+            if self.previous is None or size != self.size:
+                out.append(f"{CSI}H{CSI}2J")
+                self.size = size
+                out.append(self._board_text(cells, size))
+            else:
+                for index, (old, new) in enumerate(zip(self.previous, cells)):
+                    if old != new:
+                        row, col = divmod(index, size)
+                        out.append(f"{CSI}{2 * row + 2};{4 * col + 3}H{self._cell(new)}{Colors.ENDC}")
+            out.append(f"{CSI}{self._status_row()};1H{CSI}J")
+            if status:
+                out.append(status + "\n")
+        self.previous = cells
+        self.size = size
+        self._write("".join(out))
+
+    def message(self, text):
+        """Texte sous le plateau; remplace le message précédent."""
+        if self.ansi and self.previous is not None:
+            self._write(f"{CSI}{self._status_row()};1H{CSI}J{text}\n")
+        else:
+            self._write(text + "\n")
+
+    def text(self, block, end="\n"):
+        """Bloc de texte libre (menus); le plateau devra être redessiné en entier."""
+        self.previous = None
+        self._write(block + end)
+
+    def ask(self, prompt):
+        """input() avec une invite colorée, sans séquences ANSI hors terminal."""
+        self._write(prompt)
+        return input()
+
+    def clear(self):
+        self.previous = None
+        if self.ansi:
+            self._write(f"{CSI}H{CSI}2J")
@@ -0,0 +1,207 @@
+# Moteur du jeu : règles et IA, sans interface ni réseau.
+#
+# Ce module ne charge ni tkinter ni socket : les simulateurs, le serveur
+# et les processus de calcul peuvent l'importer rapidement.
+
+import importlib
+import random
+
+from board import Board, iter_bits
+
+# Difficultés servies par un moteur de recherche (nom de la difficulté = nom du module)
+SEARCH_ENGINES = ("mcts", "alphabeta")
+# Toutes les valeurs acceptées par TicTacToe.difficulty
+STRATEGIES = ("facile", "medium", "difficile") + SEARCH_ENGINES
+
+# Couleurs ANSI
+class Colors:
+    BLUE = '\033[94m'
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    ENDC = '\033[0m'
+
+class BoardView:
+    """Vue « liste de cases » sur le plateau d'un TicTacToe.
+
+    Permet à l'interface et à la console de continuer à lire et écrire
+    game.board[i] comme avant.
+    """
+
+    def __init__(self, grid):
+        self._grid = grid
+
+    def __len__(self):
+        return self._grid.geo.cells
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        return self._grid.cell(range(len(self))[index])
+
+    def __setitem__(self, index, value):
+        pos = range(len(self))[index]
+        self._grid.remove(pos)
+        if value in ("X", "O"):
+            self._grid.place(pos, value)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._grid.cell(i)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class TicTacToe:
+    def __init__(self, size=3, k=3):
+        # Plateau size x size, il faut aligner k symboles (voir board.py)
+        self.size = size
+        self.k = k
+        self.grid = Board(size, k)
+        self.score_x = 0
+        self.score_o = 0
+        self.difficulty = "facile"
+        # Source de hasard de l'IA; un random.Random(graine) rend les parties reproductibles
+        self.rng = random
+        # Coups joués dans l'ordre (pour le journal des parties, voir game_log.py)
+        self.moves = []
+
+    # Un masque de bits par joueur
+    @property
+    def mask_x(self):
+        return self.grid.mask_x
+
+    @property
+    def mask_o(self):
+        return self.grid.mask_o
+
+    @property
+    def board(self):
+        return BoardView(self.grid)
+
+    @board.setter
+    def board(self, cells):
+        # Accepte une liste de cases (" ", "X", "O"); l'ordre des coups est perdu
+        self.grid.reset()
+        self.moves = []
+        for i, value in enumerate(cells):
+            if value in ("X", "O"):
+                self.grid.place(i, value)
+
+    def reset(self):
+        self.grid.reset()
+        self.moves = []
+
+    def display_board(self):
+        board = list(self.board)
+        n = self.size
+        print(f"\n{Colors.BLUE}╔" + "╦".join(["═══"] * n) + "╗")
+        for i in range(0, n * n, n):
+            print("║ " + " ║ ".join(board[i:i + n]) + " ║")
+            if i < n * (n - 1):
+                print("╠" + "╬".join(["═══"] * n) + "╣")
+        # fix: use f-string so {Colors.ENDC} is expanded
+        print("╚" + "╩".join(["═══"] * n) + f"╝{Colors.ENDC}")
+
+    def snapshot(self):
+        """Copie figée de la partie : (size, k, mask_x, mask_o, difficulty)."""
+        return (self.size, self.k, self.mask_x, self.mask_o, self.difficulty)
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        size, k, mask_x, mask_o, difficulty = snapshot
+        game = cls(size, k)
+        for pos in iter_bits(mask_x):
+            game.grid.place(pos, "X")
+        for pos in iter_bits(mask_o):
+            game.grid.place(pos, "O")
+        game.difficulty = difficulty
+        return game
+
+    def make_move(self, position, player):
+        if self.grid.place(position, player):
+            self.moves.append(position)
+            return True
+        return False
+
+    def empty_mask(self):
+        return self.grid.empty_mask()
+
+    def get_empty_spaces(self):
+        return self.grid.get_empty_spaces()
+
+    def ai_move(self, player="O"):
+        # player : symbole joué par l'IA ("O" par défaut, "X" en IA contre IA)
+        # Pourcentages de chance d'utiliser la stratégie intelligente:
+        # Facile: 0% (toujours aléatoire)
+        # Medium: 50% (moitié aléatoire, moitié intelligent)
+        # Difficile: 75% (majoritairement jeu parfait, voir solver.py)
+        # MCTS / alphabeta: toujours le moteur de recherche du même nom
+        # (mcts.py, alphabeta.py), importé seulement s'il est choisi
+        
+        if self.difficulty in SEARCH_ENGINES:
+            engine = importlib.import_module(self.difficulty)
+            return engine.best_move(self, player)
+
+        random_number = self.rng.randint(1, 100)
+        
+        if self.difficulty == "facile":
+            return self.rng.choice(self.get_empty_spaces())
+        elif self.difficulty == "medium":
+            if random_number <= 50:  # 50% de chance
+                return self.get_strategic_move(player)
+            return self.rng.choice(self.get_empty_spaces())
+        else:  # difficile
+            if random_number <= 75:  # 75% de chance
+                return self.get_perfect_move()
+            return self.rng.choice(self.get_empty_spaces())
+
+    def get_perfect_move(self):
+        if (self.size, self.k) != (3, 3):
+            return self.get_strategic_move(self.grid.to_move())
+        # Import ici : la table du solveur n'est construite qu'au premier besoin
+        import solver
+        return solver.best_move(self.mask_x, self.mask_o, pick=self.rng.choice)
+
+    def get_strategic_move(self, player="O"):
+        opponent = "X" if player == "O" else "O"
+        # Vérifie d'abord si l'IA peut gagner
+        cells = self.grid.winning_cells(player)
+        if cells:
+            return next(iter_bits(cells))
+
+        # Bloque le joueur s'il peut gagner
+        cells = self.grid.winning_cells(opponent)
+        if cells:
+            return next(iter_bits(cells))
+
+        # Sinon, choix aléatoire
+        return self.rng.choice(self.get_empty_spaces())
+
+    def check_winner(self, player):
+        # Les compteurs par ligne sont mis à jour à chaque coup (voir board.py)
+        return self.grid.is_winner(player)
+
+
+def self_play(games, difficulty_x="facile", difficulty_o="facile", game=None):
+    """Joue des parties IA contre IA; retourne les totaux victoires / nuls."""
+    totals = {"x_wins": 0, "o_wins": 0, "draws": 0}
+    if game is None:
+        game = TicTacToe()
+    for _ in range(games):
+        game.reset()
+        player = "X"
+        while True:
+            game.difficulty = difficulty_x if player == "X" else difficulty_o
+            game.make_move(game.ai_move(player), player)
+            if game.check_winner(player):
+                totals["x_wins" if player == "X" else "o_wins"] += 1
+                break
+            if not game.get_empty_spaces():
+                totals["draws"] += 1
+                break
+            player = "O" if player == "X" else "X"
+    return totals
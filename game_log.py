@@ -0,0 +1,208 @@
+# Journal binaire des parties terminées (ajout seulement, quelques octets par partie).
+#
+# Fichier : en-tête MAGIC, puis les parties les unes après les autres.
+# Une partie :
+#     infos B    bits 0-1 mode, bits 2-3 difficulté, bits 4-5 résultat
+#     coups B    nombre de coups
+#     début I    heure de début (secondes depuis 1970)
+#     durée H    durée en dixièmes de seconde
+#     coups      deux coups par octet (un par demi-octet), X joue en premier
+#
+# Une partie de 3x3 prend donc de 9 à 13 octets. Le lecteur parcourt le
+# fichier avec mmap : on peut calculer des statistiques sur des millions de
+# parties sans tout charger en mémoire.
+#
+# Exemple :
+#     python game_log.py stats games.log
+#     python game_log.py blunders games.log --limit 20
+
+import argparse
+import mmap
+import os
+import struct
+import time
+from collections import Counter, namedtuple
+
+from engine import TicTacToe
+
+MAGIC = b"TTTLOG1\n"
+RECORD = struct.Struct(">BBIH")
+
+MODES = ["pve", "pvp", "online", "selfplay"]
+DIFFICULTIES = ["facile", "medium", "difficile", None]
+RESULTS = [None, "X", "O", "abandon"]   # None = match nul
+
+GameRecord = namedtuple("GameRecord", "mode difficulty result started duration moves")
+
+
+def pack_moves(moves):
+    data = bytearray((len(moves) + 1) // 2)
+    for i, position in enumerate(moves):
+        if not 0 <= position <= 15:
+            raise ValueError("le journal ne garde que les parties 3x3 (positions 0 à 8)")
+        if i % 2 == 0:
+            data[i // 2] = position << 4
+        else:
+            data[i // 2] |= position
+    return bytes(data)
+
+
+def unpack_moves(data, count):
+    moves = []
+    for i in range(count):
+        byte = data[i // 2]
+        moves.append(byte >> 4 if i % 2 == 0 else byte & 0x0F)
+    return moves
+
+
+def encode_record(record):
+    info = (MODES.index(record.mode)
+            | DIFFICULTIES.index(record.difficulty) << 2
+            | RESULTS.index(record.result) << 4)
+    duration = min(int(record.duration * 10), 0xFFFF)
+    return RECORD.pack(info, len(record.moves), int(record.started), duration) + pack_moves(record.moves)
+
+
+class GameLog:
+    def __init__(self, path):
+        self.path = path
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "ab")
+        if new_file:
+            self._file.write(MAGIC)
+            self._file.flush()
+
+    def append(self, record):
+        self._file.write(encode_record(record))
+        self._file.flush()
+
+    def record_game(self, game, mode, result, started):
+        """Ajoute une partie terminée d'un TicTacToe (coups dans game.moves)."""
+        if (game.size, game.k) != (3, 3):
+            return
+        difficulty = game.difficulty if mode in ("pve", "selfplay") else None
+        if difficulty not in DIFFICULTIES:
+            difficulty = None   # stratégies sans code dans le journal (mcts...)
+        self.append(GameRecord(mode, difficulty, result, started,
+                               time.time() - started, list(game.moves)))
+
+    def close(self):
+        self._file.close()
+
+
+def _open_map(path):
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size <= len(MAGIC):
+            return None
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if data[:len(MAGIC)] != MAGIC:
+        data.close()
+        raise ValueError(f"{path} n'est pas un journal de parties")
+    return data
+
+
+def iter_records(path):
+    """Parcourt les parties du journal, une à la fois."""
+    data = _open_map(path)
+    if data is None:
+        return
+    try:
+        offset = len(MAGIC)
+        end = len(data)
+        while offset + RECORD.size <= end:
+            info, count, started, duration = RECORD.unpack_from(data, offset)
+            offset += RECORD.size
+            size = (count + 1) // 2
+            if offset + size > end:
+                break  # dernière partie incomplète (écriture interrompue)
+            moves = unpack_moves(data[offset:offset + size], count)
+            offset += size
+            yield GameRecord(MODES[info & 3], DIFFICULTIES[info >> 2 & 3],
+                             RESULTS[info >> 4 & 3], started, duration / 10, moves)
+    finally:
+        data.close()
+
+
+def summarize(path):
+    """Compte les résultats par (mode, difficulté) sans décoder les coups."""
+    counts = Counter()
+    total_moves = 0
+    data = _open_map(path)
+    if data is None:
+        return {"games": 0, "moves": 0, "results": {}}
+    try:
+        offset = len(MAGIC)
+        end = len(data)
+        while offset + RECORD.size <= end:
+            info = data[offset]
+            count = data[offset + 1]
+            offset += RECORD.size + (count + 1) // 2
+            if offset > end:
+                break
+            counts[(MODES[info & 3], DIFFICULTIES[info >> 2 & 3], RESULTS[info >> 4 & 3])] += 1
+            total_moves += count
+    finally:
+        data.close()
+    return {"games": sum(counts.values()), "moves": total_moves, "results": dict(counts)}
+
+
+def find_blunders(record, players=("X", "O")):
+    """Rejoue une partie et signale les coups qui font baisser la valeur théorique.
+
+    Retourne une liste de (numéro du coup, joueur, position, valeur avant, valeur après),
+    les valeurs étant vues par le joueur qui joue (+1 gagné, 0 nul, -1 perdu).
+    """
+    import solver
+
+    game = TicTacToe()
+    blunders = []
+    player = "X"
+    for ply, position in enumerate(record.moves):
+        before = solver.position_value(game.mask_x, game.mask_o)
+        if not game.make_move(position, player):
+            raise ValueError(f"coup {ply + 1} invalide: case {position} occupée")
+        if game.check_winner(player):
+            after = 1
+        elif not game.get_empty_spaces():
+            after = 0
+        else:
+            after = -solver.position_value(game.mask_x, game.mask_o)
+        if after < before and player in players:
+            blunders.append((ply + 1, player, position, before, after))
+        if game.check_winner(player):
+            break
+        player = "O" if player == "X" else "X"
+    return blunders
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Journal des parties")
+    parser.add_argument("command", choices=["stats", "blunders"])
+    parser.add_argument("path")
+    parser.add_argument("--limit", type=int, default=20, help="parties affichées (blunders)")
+    parser.add_argument("--player", choices=["X", "O"], default="O",
+                        help="joueur à analyser (O = l'IA en mode pve)")
+    args = parser.parse_args()
+
+    if args.command == "stats":
+        start = time.perf_counter()
+        summary = summarize(args.path)
+        elapsed = time.perf_counter() - start
+        print(f"{summary['games']} parties, {summary['moves']} coups ({elapsed:.2f} s)")
+        for (mode, difficulty, result), count in sorted(summary["results"].items(), key=str):
+            print(f"  {mode:8} {difficulty or '-':9} {result or 'nul':7} {count}")
+    else:
+        shown = 0
+        for index, record in enumerate(iter_records(args.path)):
+            blunders = find_blunders(record, players=(args.player,))
+            if blunders:
+                print(f"partie {index} ({record.mode}, {record.difficulty}): {record.moves}")
+                for ply, player, position, before, after in blunders:
+                    print(f"  coup {ply}: {player} en {position + 1} ({before:+d} -> {after:+d})")
+                shown += 1
+                if shown >= args.limit:
+                    break
+
+
+if __name__ == "__main__":
+    main()
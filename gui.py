@@ -0,0 +1,534 @@
+# Fenêtre de jeu Tk.
+
+import logging
+import os
+import sys
+import time
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from ai_worker import AIWorker
+from animation import Scheduler, blink, tween
+from engine import TicTacToe
+from game_log import GameLog
+from network import NetworkManager
+from prediction import Prediction
+from render import CellRenderer
+
+logger = logging.getLogger(__name__)
+
+# Journal des parties terminées, à côté du jeu (voir game_log.py)
+GAME_LOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "games.log")
+
+
+class TicTacToeGUI:
+    def __init__(self, size=3, k=3, server=None):
+        # server : (hôte, port) du serveur de parties; avec server, la connexion est lancée au démarrage
+        self.game = TicTacToe(size, k)
+        self.server = server or ('localhost', 5000)
+        self.network = NetworkManager(*self.server)
+        # Coups en ligne affichés tout de suite, confirmés par le serveur ensuite
+        self.prediction = Prediction(self.game, self.network)
+        self.network_symbol = None
+        self._link = None   # NetworkManager de la connexion en cours (None hors ligne)
+        self.window = tk.Tk()
+        self.window.title("TicTacToeFuture")
+        self.window.configure(bg='#2C3E50')  # Fond bleu foncé moderne
+        
+        # Configuration du style
+        style = ttk.Style()
+        style.configure('Game.TButton', 
+                       font=('Helvetica', 24, 'bold'),
+                       padding=20,
+                       background='#34495E',
+                       foreground='#ECF0F1')
+        
+        # Titre du jeu
+        title_frame = tk.Frame(self.window, bg='#2C3E50')
+        title_frame.grid(row=0, column=0, columnspan=3, pady=10)
+        title_label = tk.Label(title_frame,
+                             text="TicTacToeFuture",
+                             font=('Helvetica', 20, 'bold'),
+                             fg='#E74C3C',
+                             bg='#2C3E50')
+        title_label.pack()
+        
+        # Indicateur de tour
+        self.turn_label = tk.Label(title_frame,
+                                 text="Tour: Joueur X",
+                                 font=('Helvetica', 14),
+                                 fg='#ECF0F1',
+                                 bg='#2C3E50')
+        self.turn_label.pack(pady=5)
+        
+        # Grille de jeu avec bordures et effets
+        game_frame = tk.Frame(self.window, bg='#34495E', padx=10, pady=10)
+        game_frame.grid(row=1, column=0, columnspan=3)
+        
+        self.buttons = []
+        n = self.game.size
+        # Police plus petite pour les grands plateaux
+        cell_font = 32 if n <= 3 else max(10, 96 // n)
+        # Style des cases
+        for i in range(n):
+            for j in range(n):
+                button = tk.Button(
+                    game_frame,
+                    text="",
+                    font=('Helvetica', cell_font, 'bold'),
+                    width=3,
+                    height=1,
+                    bg='#ECF0F1',
+                    activebackground='#3498DB',  # Effet hover
+                    relief=tk.RAISED,
+                    bd=5,  # Bordure 3D
+                    command=lambda x=i, y=j: self.make_move(x*n + y)
+                )
+                button.grid(row=i, column=j, padx=5 if n <= 3 else 1, pady=5 if n <= 3 else 1)
+                index = len(self.buttons)
+                button.bind('<Enter>', lambda e, index=index: self.on_hover(index, True))
+                button.bind('<Leave>', lambda e, index=index: self.on_hover(index, False))
+                self.buttons.append(button)
+
+        # Toutes les mises à jour des cases passent par le renderer (voir render.py)
+        self.renderer = CellRenderer(self.window, self.buttons, {
+            "text": "", "bg": '#ECF0F1', "state": tk.NORMAL,
+            "font": ('Helvetica', cell_font, 'bold'),
+        })
+        
+        # Panel de contrôle
+        control_frame = tk.Frame(self.window, bg='#2C3E50')
+        control_frame.grid(row=2, column=0, columnspan=3, pady=10)
+        
+        # Sélecteur de difficulté stylisé
+        diff_label = tk.Label(control_frame,
+                            text="Difficulté:",
+                            font=('Helvetica', 12),
+                            fg='#ECF0F1',
+                            bg='#2C3E50')
+        diff_label.pack(pady=5)
+        
+        # Boutons de difficulté avec couleurs
+        difficulties = [
+            ("Facile", "facile", '#2ECC71'),
+            ("Medium", "medium", '#F1C40F'),
+            ("Difficile", "difficile", '#E74C3C')
+        ]
+        
+        diff_buttons_frame = tk.Frame(control_frame, bg='#2C3E50')
+        diff_buttons_frame.pack()
+        
+        for text, value, color in difficulties:
+            btn = tk.Button(
+                diff_buttons_frame,
+                text=text,
+                command=lambda v=value: self.set_difficulty(v),
+                bg=color,
+                fg='white',
+                font=('Helvetica', 10, 'bold'),
+                width=10,
+                relief=tk.RAISED
+            )
+            btn.pack(side=tk.LEFT, padx=5)
+        
+        # Score
+        self.score_label = tk.Label(control_frame,
+                                  text="Score - Joueur: 0  IA: 0",
+                                  font=('Helvetica', 12),
+                                  fg='#ECF0F1',
+                                  bg='#2C3E50')
+        self.score_label.pack(pady=10)
+        
+        # Boutons de contrôle
+        control_buttons_frame = tk.Frame(control_frame, bg='#2C3E50')
+        control_buttons_frame.pack(pady=5)
+        
+        # Bouton Reset
+        reset_button = tk.Button(
+            control_buttons_frame,
+            text="Reset (R)",
+            command=self.on_reset,
+            bg='#3498DB',
+            fg='white',
+            font=('Helvetica', 10, 'bold'),
+            width=10
+        )
+        reset_button.pack(side=tk.LEFT, padx=5)
+        
+        # Bouton Quitter
+        quit_button = tk.Button(
+            control_buttons_frame,
+            text="Quitter (ESC)",
+            command=self.quit_game,
+            bg='#E74C3C',
+            fg='white',
+            font=('Helvetica', 10, 'bold'),
+            width=10
+        )
+        quit_button.pack(side=tk.LEFT, padx=5)
+
+        # Mode toggle button (VS IA / 2 joueurs)
+        self.mode = 'pve'  # 'pve' = player vs AI, 'pvp' = local 2 players
+        self.current_player = 'X'  # used in pvp mode
+        self.mode_button = tk.Button(
+            control_buttons_frame,
+            text="Mode: VS IA",
+            command=self.toggle_mode,
+            bg='#9B59B6',
+            fg='white',
+            font=('Helvetica', 10, 'bold'),
+            width=12
+        )
+        self.mode_button.pack(side=tk.LEFT, padx=5)
+
+        # Bouton Jouer en ligne (serveur de server.py)
+        online_button = tk.Button(
+            control_buttons_frame,
+            text="Jouer en ligne",
+            command=self.connect_to_server,
+            bg='#16A085',
+            fg='white',
+            font=('Helvetica', 10, 'bold'),
+            width=12
+        )
+        online_button.pack(side=tk.LEFT, padx=5)
+
+        # Bind keyboard shortcuts (normalized indentation)
+        self.window.bind('<Escape>', lambda e: self.quit_game())
+        self.window.bind('r', lambda e: self.on_reset())
+
+        # Initialisation des variables manquantes
+        self._last_move = time.time()
+        self._move_delay = 0.3
+        self.animate_victory = False
+        self.scheduler = Scheduler(self.window)
+        # small think delay to improve UX (budget, pas un sleep)
+        self.ai_worker = AIWorker(self.window, TicTacToe.from_snapshot, think_ms=250)
+        try:
+            self.game_log = GameLog(GAME_LOG_PATH)
+        except OSError:
+            # dossier en lecture seule : le journal est optionnel, on joue sans lui
+            self.game_log = None
+        self._started = time.time()
+        self.update_score_label()
+        self.ai_worker.ponder(self.game.snapshot())
+        if server is not None:
+            self.window.after(0, self.connect_to_server)
+
+    def connect_to_server(self):
+        if self._link is not None:
+            return   # déjà connecté (en attente d'un adversaire ou en partie)
+        # Un socket qui a échoué ne peut pas resservir : nouvelle connexion à chaque essai
+        self.network = NetworkManager(*self.server)
+        self.prediction.network = self.network
+        if self.network.connect():
+            self._link = network = self.network
+            # Le "hello" est échangé sur le thread lecteur : la fenêtre ne se fige jamais
+            self.network.start_reader(self.window, lambda message: self.on_network_message(message, network),
+                                      negotiate=True)
+            self.turn_label.config(text="Connecté : en attente d'un adversaire...")
+        else:
+            messagebox.showerror("Erreur", "Impossible de se connecter au serveur")
+
+    def leave_online(self):
+        """Ferme la connexion (abandon si une partie est en cours) et revient au jeu contre l'IA."""
+        link, self._link = self._link, None
+        if link is not None:
+            link.close()
+        self.network_symbol = None
+        if self.mode == 'online':
+            self.mode = 'pve'
+            self.mode_button.config(text="Mode: VS IA")
+
+    def on_network_message(self, message, network=None):
+        # Appelé sur le thread de l'interface (voir NetworkManager._drain)
+        if network is not self._link:
+            return   # message d'une connexion déjà fermée
+        kind = message.get("type")
+        if kind == "waiting":
+            self.turn_label.config(text="Connecté : en attente d'un adversaire...")
+        elif kind == "start":
+            self.mode = 'online'
+            self.mode_button.config(text="Mode: En ligne")
+            self.reset_game()
+            self.network_symbol = message.get("symbol")
+            self.update_online_label()
+        elif kind == "disconnected":
+            self.leave_online()
+            self.reset_game()
+            self.turn_label.config(text="Déconnecté du serveur")
+        elif self.mode != 'online':
+            return   # coups et fin de partie : seulement pendant une partie en ligne
+        elif kind in ("move", "ack", "error"):
+            self.prediction.on_message(message)
+            # Le renderer ne touche que les cases qui ont vraiment changé
+            self.redraw_board()
+            self.update_online_label()
+        elif kind == "end":
+            winner = message.get("winner")
+            messagebox.showinfo("Fin", f"Gagnant: {winner}" if winner else "Match nul!")
+            # Le serveur ferme la connexion après "end" : "Jouer en ligne" pour rejouer
+            self.leave_online()
+            self.reset_game()
+
+    def on_reset(self):
+        # Bouton Reset et touche R : en ligne, c'est un abandon de la partie
+        if self.mode == 'online':
+            self.leave_online()
+        self.reset_game()
+
+    def set_difficulty(self, difficulty):
+        if self.mode == 'online':
+            self.leave_online()
+        self.game.difficulty = difficulty
+        messagebox.showinfo("Difficulté", f"Niveau: {difficulty}")
+        self.reset_game()
+
+    def on_hover(self, index, entering):
+        if entering and self.renderer.get(index, "text") == "":
+            self.renderer.set(index, bg='#BDC3C7')
+        else:
+            self.renderer.set(index, bg='#ECF0F1')
+
+    def toggle_mode(self):
+        """Basculer entre VS IA et 2 joueurs locaux (en ligne : abandon, retour VS IA)."""
+        if self.mode == 'online':
+            self.leave_online()
+            self.reset_game()
+            return
+        if self.mode == 'pve':
+            self.mode = 'pvp'
+            self.mode_button.config(text="Mode: 2 joueurs")
+            self.current_player = 'X'
+            self.turn_label.config(text="Tour: Joueur X")
+        else:
+            self.mode = 'pve'
+            self.mode_button.config(text="Mode: VS IA")
+            self.current_player = 'X'
+            self.turn_label.config(text="Tour: Joueur X")
+        self.reset_game()
+
+    def make_move(self, position):
+        # refuse input during victory animation
+        if hasattr(self, 'animate_victory') and self.animate_victory:
+            return
+
+        current_time = time.time()
+        if current_time - self._last_move < self._move_delay:
+            return
+
+        self._last_move = current_time
+        # compteur d'appels Tk par coup (voir render.py)
+        self.renderer.mark_move()
+
+        try:
+            if self.mode == 'online':
+                # Coup affiché sans attendre le serveur (voir prediction.py)
+                if self.game.grid.to_move() == self.network_symbol:
+                    if self.prediction.play(position, self.network_symbol):
+                        self.redraw_board()
+                return
+
+            # Determine player based on mode
+            if self.mode == 'pve':
+                player = 'X'  # human always X
+            else:  # pvp local
+                player = self.current_player
+
+            # Only allow move on empty cell
+            if not self.game.make_move(position, player):
+                return
+
+            # Update UI for the placed symbol
+            color = '#E74C3C' if player == 'X' else '#2ECC71'
+            self.renderer.set(position, text=player, fg=color, state=tk.DISABLED)
+
+            # Update turn label
+            if self.mode == 'pvp':
+                # switch turns for local players
+                if self.game.check_winner(player):
+                    # score and victory
+                    if player == 'X':
+                        self.game.score_x += 1
+                    else:
+                        self.game.score_o += 1
+                    self.update_score_label()
+                    self.record_game(player)
+                    self.animate_victory_line(player)
+                    return
+                # check draw
+                if not self.game.get_empty_spaces():
+                    self.record_game(None)
+                    messagebox.showinfo("Match nul", "Match nul!")
+                    self.reset_game()
+                    return
+                # switch current player for next click
+                self.current_player = 'O' if self.current_player == 'X' else 'X'
+                self.turn_label.config(text=f"Tour: Joueur {self.current_player}")
+                # enable only empty spots
+                self.enable_board()
+            else:
+                # PV E mode: after player X move, check win, then AI move
+                # disable board while AI thinks
+                self.disable_board()
+
+                if self.game.check_winner('X'):
+                    self.game.score_x += 1
+                    self.update_score_label()
+                    self.record_game('X')
+                    self.animate_victory_line('X')
+                    return
+                # X remplit la dernière case en 3x3 : match nul sans demander à l'IA
+                if not self.game.get_empty_spaces():
+                    self.record_game(None)
+                    messagebox.showinfo("Match nul", "Match nul!")
+                    self.reset_game()
+                    return
+
+                # l'IA calcule sur son thread, à partir d'une copie figée du plateau
+                self.ai_worker.submit(self.game.snapshot(), self._update_ai_move)
+
+        except Exception as e:
+            messagebox.showerror("Erreur", str(e))
+
+    def animate_symbol(self, button, symbol):
+        # Animation d'apparition du symbole (sans bloquer la fenêtre)
+        button.config(text=symbol)
+        self.scheduler.spawn(
+            tween(lambda size: button.config(font=('Helvetica', size, 'bold')), 10, 30, step=2),
+            tag="symbol")
+
+    def animate_victory_line(self, winner):
+        self.animate_victory = True
+        win_color = '#E74C3C' if winner == "X" else '#2ECC71'
+        
+        # Faire clignoter les cases gagnantes; la fenêtre reste active pendant ce temps
+        winning_buttons = [self.renderer.cell(pos) for pos in self.get_winning_line()]
+        self.scheduler.spawn(blink(winning_buttons, win_color, '#ECF0F1', times=5, interval_ms=200),
+                             tag="victory",
+                             on_done=lambda: self._end_victory(winner))
+
+    def _end_victory(self, winner):
+        message = "Vous avez gagné!" if winner == "X" else "L'IA a gagné!"
+        messagebox.showinfo("Fin", message)
+        self.animate_victory = False
+        self.reset_game()
+
+    def get_winning_line(self):
+        # Retourne les positions de la ligne gagnante
+        return list(self.game.grid.winning_line())
+
+    def _update_ai_move(self, ai_pos):
+        try:
+            # if AI couldn't find a pos (safety)
+            if ai_pos is None:
+                self.enable_board()
+                if self.ai_worker.last_error is not None:
+                    messagebox.showerror("Erreur", f"Erreur IA: {self.ai_worker.last_error}")
+                return
+
+            self.game.make_move(ai_pos, "O")
+            self.renderer.set(ai_pos, text="O", fg='#2ECC71', state=tk.DISABLED)
+            self.turn_label.config(text="Tour: Joueur X")
+
+            if self.game.check_winner("O"):
+                self.game.score_o += 1
+                self.update_score_label()
+                self.record_game("O")
+                self.animate_victory_line("O")
+                return
+
+            # enable board so player can move
+            self.enable_board()
+
+            # if board full => draw
+            if not self.game.get_empty_spaces():
+                self.record_game(None)
+                messagebox.showinfo("Match nul", "Match nul!")
+                self.reset_game()
+                return
+
+            # l'IA prépare ses réponses pendant que le joueur réfléchit
+            self.ai_worker.ponder(self.game.snapshot())
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Erreur IA: {str(e)}")
+            self.enable_board()
+
+    def redraw_board(self):
+        for position, value in enumerate(self.game.board):
+            if value == " ":
+                self.renderer.set(position, text="", state=tk.NORMAL)
+            else:
+                color = '#E74C3C' if value == 'X' else '#2ECC71'
+                self.renderer.set(position, text=value, fg=color, state=tk.DISABLED)
+
+    def update_online_label(self):
+        rtt = self.prediction.rtt_ms
+        ping = f"  RTT {rtt:.0f} ms" if rtt is not None else ""
+        self.turn_label.config(text=f"En ligne: vous jouez {self.network_symbol}{ping}")
+
+    def reset_game(self):
+        # Animation of reset simplified to avoid blocking
+        self.scheduler.cancel()
+        self.prediction.reset()
+        # les réponses de l'IA pour l'ancienne partie seront ignorées
+        self.ai_worker.new_generation()
+        self.renderer.set_all(bg='#ECF0F1', text="", state=tk.NORMAL, fg='black')
+        self.game.reset()
+        self._started = time.time()
+        self.turn_label.config(text="Tour: Joueur X")
+        self.animate_victory = False
+        self.current_player = 'X'
+        self.enable_board()
+        self.update_score_label()
+        if self.mode == 'pve':
+            self.ai_worker.ponder(self.game.snapshot())
+
+    def record_game(self, result):
+        # result : "X", "O" ou None pour un match nul
+        mode = "pve" if self.mode == 'pve' else "pvp"
+        if self.game_log is None:
+            return
+        try:
+            self.game_log.record_game(self.game, mode, result, self._started)
+        except OSError:
+            # le journal est optionnel : on continue sans lui
+            pass
+
+    def update_score_label(self):
+        try:
+            self.score_label.config(text=f"Score - Joueur: {self.game.score_x}  IA: {self.game.score_o}")
+        except Exception:
+            # score label may not exist in some flows; ignore
+            pass
+
+    # Disable / enable board to prevent clicks while AI is thinking
+    def disable_board(self):
+        self.renderer.set_all(state=tk.DISABLED)
+
+    def enable_board(self):
+        empty = self.game.empty_mask()
+        for i in range(len(self.buttons)):
+            # only enable empty spots
+            if empty >> i & 1:
+                self.renderer.set(i, state=tk.NORMAL)
+            else:
+                self.renderer.set(i, state=tk.DISABLED)
+
+    def quit_game(self):
+        if messagebox.askokcancel("Quitter", "Voulez-vous vraiment quitter le jeu?"):
+            # images perdues et retard de la boucle Tk pendant les animations
+            logger.info("animations : %s", self.scheduler.stats())
+            self.window.quit()
+            sys.exit(0)
+
+    def run(self):
+        if "metrics" in sys.modules and sys.modules["metrics"].enabled:
+            sys.modules["metrics"].LagSampler(self.window)
+            sys.modules["metrics"].gauge("animation", self.scheduler.stats)
+            sys.modules["metrics"].gauge("render", self.renderer.stats)
+        try:
+            self.window.mainloop()
+        except Exception as e:
+            messagebox.showerror("Erreur Critique", f"Erreur: {str(e)}")
+            sys.exit(1)
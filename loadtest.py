@@ -0,0 +1,219 @@
+# Essai de charge du serveur : des milliers de clients simulés (asyncio).
+#
+# Chaque client parle le même protocole que NetworkManager : il se connecte,
+# attend "start", puis joue des coups légaux choisis par TicTacToe.ai_move
+# ({"type": "move", "position", "timestamp", "seq"}). Le temps entre l'envoi
+# d'un coup et son "ack" est le RTT mesuré. À la fin de la partie, le client
+# se reconnecte pour la suivante, jusqu'à la fin de la durée prévue. À cette
+# heure limite, les clients encore connectés sont arrêtés : les débits sont
+# calculés sur la seule fenêtre de charge, et l'attente d'un client resté
+# sans adversaire n'est comptée ni dans la durée ni comme erreur.
+#
+# Sans --port, un serveur local (server.py) est lancé dans un sous-processus
+# sur un port libre, puis arrêté à la fin. Le résultat est un JSON :
+# débit (coups/s, parties/s), RTT p50/p99/p999 et erreurs par type.
+#
+# Exemple :
+#     python loadtest.py --clients 2000 --duration 20
+#     python loadtest.py --port 5000 --clients 500 --out charge.json
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter
+
+from engine import TicTacToe
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))
+    return sorted_values[index]
+
+
+class Stats:
+    def __init__(self, deadline):
+        self.deadline = deadline   # rien n'est compté après (perf_counter)
+        self.rtts = []          # ms
+        self.moves = 0
+        self.games = 0
+        self.errors = Counter()
+
+
+async def play_game(host, port, difficulty, stats, timeout):
+    """Une partie complète pour un client; retourne False si la connexion a échoué."""
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        stats.errors["connect"] += 1
+        return False
+    game = TicTacToe()
+    game.difficulty = difficulty
+    symbol = None
+    seq = 0
+    sent = {}
+
+    async def send_move():
+        nonlocal seq
+        seq += 1
+        position = game.ai_move(symbol)
+        game.make_move(position, symbol)
+        sent[seq] = time.perf_counter()
+        writer.write(json.dumps({"type": "move", "position": position,
+                                 "timestamp": time.time(), "seq": seq}).encode() + b"\n")
+        await writer.drain()
+
+    try:
+        while True:
+            line = await asyncio.wait_for(reader.readline(), timeout)
+            if not line:
+                stats.errors["closed"] += 1
+                return True
+            message = json.loads(line)
+            kind = message.get("type")
+            if kind == "start":
+                symbol = message["symbol"]
+                if symbol == "X":
+                    await send_move()
+            elif kind == "ack":
+                now = time.perf_counter()
+                start = sent.pop(message.get("seq"), None)
+                if now > stats.deadline:
+                    continue
+                if start is not None:
+                    stats.rtts.append((now - start) * 1000)
+                stats.moves += 1
+            elif kind == "move":
+                game.make_move(message["position"], message["player"])
+                if not game.check_winner(message["player"]) and game.get_empty_spaces():
+                    await send_move()
+            elif kind == "end":
+                if time.perf_counter() > stats.deadline:
+                    return True
+                if message.get("reason") in ("victoire", "nul"):
+                    stats.games += 1
+                else:
+                    stats.errors[message.get("reason") or "end"] += 1
+                return True
+            elif kind == "error":
+                stats.errors["protocol"] += 1
+    except asyncio.TimeoutError:
+        stats.errors["timeout"] += 1
+    except (OSError, ValueError):
+        stats.errors["io"] += 1
+    finally:
+        writer.close()
+    return True
+
+
+async def client(host, port, difficulty, stats, deadline, timeout):
+    while time.perf_counter() < deadline:
+        if not await play_game(host, port, difficulty, stats, timeout):
+            await asyncio.sleep(0.1)   # serveur saturé : on réessaie un peu plus tard
+
+
+async def swarm(host, port, clients, duration, difficulty, timeout, ramp):
+    start = time.perf_counter()
+    deadline = start + duration
+    stats = Stats(deadline)
+    tasks = []
+    for i in range(clients):
+        tasks.append(asyncio.create_task(client(host, port, difficulty, stats, deadline, timeout)))
+        if ramp and i % 100 == 99:
+            await asyncio.sleep(ramp)   # montée en charge par paquets de 100
+    # À l'heure limite, les clients encore en attente (d'un adversaire, d'un coup) sont arrêtés
+    _, pending = await asyncio.wait(tasks, timeout=max(0.0, deadline - time.perf_counter()))
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    elapsed = min(time.perf_counter(), deadline) - start
+    rtts = sorted(stats.rtts)
+    return {
+        "clients": clients,
+        "duration_s": round(elapsed, 3),
+        "games": stats.games,
+        "moves": stats.moves,
+        "games_per_s": round(stats.games / elapsed, 1),
+        "moves_per_s": round(stats.moves / elapsed, 1),
+        "rtt_ms": {"p50": percentile(rtts, 50), "p99": percentile(rtts, 99),
+                   "p999": percentile(rtts, 99.9), "max": rtts[-1] if rtts else None},
+        "errors": dict(stats.errors),
+    }
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_local_server(port):
+    """Lance server.py sur 127.0.0.1:port et attend qu'il accepte les connexions."""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py")
+    process = subprocess.Popen([sys.executable, script, "--host", "127.0.0.1", "--port", str(port)],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(100):
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.1) as probe:
+                probe.settimeout(2.0)
+                probe.recv(64)   # "waiting" : le serveur a inscrit la sonde
+        except OSError:
+            time.sleep(0.05)
+            continue
+        # Laisse le serveur voir la fermeture, sinon le premier client serait jumelé à la sonde
+        time.sleep(0.2)
+        return process
+    process.kill()
+    raise RuntimeError("le serveur local n'a pas démarré")
+
+
+def _raise_fd_limit():
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Essai de charge du serveur TicTacToe")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="serveur existant (sinon server.py est lancé)")
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=10.0, help="secondes")
+    parser.add_argument("--difficulty", default="medium")
+    parser.add_argument("--timeout", type=float, default=10.0, help="attente max d'un message")
+    parser.add_argument("--ramp", type=float, default=0.01, help="pause entre paquets de 100 clients")
+    parser.add_argument("--out", help="écrit aussi le JSON dans ce fichier")
+    args = parser.parse_args()
+
+    _raise_fd_limit()
+    process = None
+    port = args.port
+    if port is None:
+        port = _free_port()
+        process = start_local_server(port)
+    try:
+        result = asyncio.run(swarm(args.host, port, args.clients, args.duration,
+                                   args.difficulty, args.timeout, args.ramp))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    text = json.dumps(result, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
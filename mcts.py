@@ -0,0 +1,175 @@
+# Recherche arborescente Monte-Carlo (UCT) pour les grands plateaux.
+#
+# La recherche exhaustive est impossible au-delà du 3x3. MCTS joue plutôt
+# des milliers de parties au hasard (« playouts ») à partir de la position
+# et concentre ses essais sur les coups qui gagnent le plus souvent.
+#
+# Parallélisme « à la racine » : chaque processus du ProcessPoolExecutor
+# construit son propre arbre avec une graine différente, puis on additionne
+# le nombre de visites de chaque coup. Chaque processus fait toutes les
+# itérations demandées : plus de cœurs = plus de playouts au total, que la
+# recherche soit limitée par les itérations ou par le temps. Elle s'arrête
+# après `iterations` itérations par processus ou à une échéance (secondes),
+# selon ce qui arrive en premier. L'échéance est en time.monotonic(), une
+# horloge commune à tous les processus (perf_counter n'a pas de référence
+# partagée).
+#
+# Utilisation : game.difficulty = "mcts", puis game.ai_move() (voir engine.py).
+
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from board import Board, candidate_moves, iter_bits
+
+EXPLORATION = math.sqrt(2)
+
+
+class Node:
+    __slots__ = ("move", "parent", "player", "children", "untried", "wins", "visits")
+
+    def __init__(self, move, parent, player, untried):
+        self.move = move
+        self.parent = parent
+        self.player = player          # joueur qui vient de jouer `move`
+        self.children = []
+        self.untried = untried
+        self.wins = 0.0
+        self.visits = 0
+
+    def best_child(self):
+        log_visits = math.log(self.visits)
+        return max(self.children,
+                   key=lambda child: child.wins / child.visits
+                   + EXPLORATION * math.sqrt(log_visits / child.visits))
+
+
+def _other(player):
+    return "O" if player == "X" else "X"
+
+
+def _playout(board, player, rng):
+    """Partie au hasard; retourne le gagnant ou None (nul)."""
+    cells = list(iter_bits(board.empty_mask()))
+    rng.shuffle(cells)
+    for cell in cells:
+        board.place(cell, player)
+        if board.is_winner(player):
+            return player
+        player = _other(player)
+    return None
+
+
+def search_tree(n, k, mask_x, mask_o, player, iterations, deadline, seed):
+    """Une recherche UCT complète; retourne {coup: (visites, victoires)} à la racine."""
+    rng = random.Random(seed)
+    root_board = Board(n, k)
+    for cell in iter_bits(mask_x):
+        root_board.place(cell, "X")
+    for cell in iter_bits(mask_o):
+        root_board.place(cell, "O")
+    root = Node(None, None, _other(player), candidate_moves(root_board))
+
+    for iteration in range(iterations):
+        if iteration % 16 == 0 and time.monotonic() > deadline:
+            break
+        node = root
+        board = root_board.copy()
+
+        # 1. Sélection
+        while not node.untried and node.children:
+            node = node.best_child()
+            board.place(node.move, node.player)
+
+        # 2. Expansion
+        winner = None
+        if node.untried:
+            move = node.untried.pop(rng.randrange(len(node.untried)))
+            mover = _other(node.player)
+            board.place(move, mover)
+            if board.is_winner(mover):
+                winner = mover
+                untried = []
+            else:
+                untried = candidate_moves(board)
+            child = Node(move, node, mover, untried)
+            node.children.append(child)
+            node = child
+        elif board.is_winner(node.player):
+            winner = node.player
+
+        # 3. Simulation
+        if winner is None and node.untried:
+            winner = _playout(board, _other(node.player), rng)
+
+        # 4. Rétropropagation
+        while node is not None:
+            node.visits += 1
+            if winner == node.player:
+                node.wins += 1
+            elif winner is None:
+                node.wins += 0.5
+            node = node.parent
+
+    return {child.move: (child.visits, child.wins) for child in root.children}
+
+
+class MCTS:
+    def __init__(self, iterations=20_000, time_limit=1.0, workers=None):
+        # iterations : par processus (le budget total grandit avec le nombre de cœurs)
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = None
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def search(self, board, player, rng=random):
+        """Meilleur coup pour player sur un board.Board; None si le plateau est plein."""
+        if not board.empty_mask():
+            return None
+        # Victoire immédiate ou blocage forcé : inutile de chercher
+        for who in (player, _other(player)):
+            cells = board.winning_cells(who)
+            if cells:
+                return next(iter_bits(cells))
+
+        # time_limit None : seulement le nombre d'itérations (résultat reproductible)
+        deadline = math.inf if self.time_limit is None else time.monotonic() + self.time_limit
+        args = (board.n, board.k, board.mask_x, board.mask_o, player)
+        if self.workers == 1:
+            results = [search_tree(*args, self.iterations, deadline, rng.getrandbits(32))]
+        else:
+            pool = self._pool()
+            futures = [pool.submit(search_tree, *args, self.iterations, deadline, rng.getrandbits(32))
+                       for _ in range(self.workers)]
+            results = [future.result() for future in futures]
+
+        visits = {}
+        for result in results:
+            for move, (count, _) in result.items():
+                visits[move] = visits.get(move, 0) + count
+        if not visits:
+            return rng.choice(board.get_empty_spaces())
+        return max(visits, key=visits.get)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+_default = None
+
+
+def best_move(game, player="O"):
+    """Stratégie pour TicTacToe.ai_move (difficulté "mcts")."""
+    global _default
+    if _default is None:
+        _default = MCTS()
+    return _default.search(game.grid, player, game.rng)
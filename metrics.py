@@ -0,0 +1,268 @@
+# Mesures des fonctions chaudes : nombre d'appels et histogrammes de latence.
+#
+# Désactivé par défaut et alors gratuit : les fonctions ne sont pas touchées.
+# enable() remplace les fonctions listées dans TARGETS par une enveloppe qui
+# mesure la durée de chaque appel (perf_counter_ns); disable() remet les
+# originales. enable() n'importe aucun module : ceux qui ne sont pas encore
+# chargés (gui, network...) sont mesurés au moment où le programme les
+# importe, ce qui garde les imports paresseux de tictactoe.py. Les durées
+# vont dans des histogrammes logarithmiques de taille fixe (16 paliers par
+# puissance de 2, erreur < 7 %), d'où p50 / p95 / p99.
+#
+# Sorties :
+#     snapshot()            dictionnaire (JSON) de toutes les mesures
+#     enable(json_path=...) écrit le JSON à la sortie et sur SIGUSR1
+#     serve(port)           texte au format Prometheus sur 127.0.0.1:port
+#     LagSampler(window)    retard de la boucle Tk (gui.py le démarre)
+#     gauge(name, func)     valeurs instantanées ajoutées aux sorties (ex. images
+#                           perdues du Scheduler d'animation.py)
+#
+# Exemple :
+#     python tictactoe.py --gui --metrics metrics.json --metrics-port 9108
+
+import atexit
+import functools
+import importlib.abc
+import importlib.util
+import json
+import signal
+import sys
+import threading
+import time
+
+# (module, classe, méthode) mesurées par enable()
+TARGETS = [
+    ("engine", "TicTacToe", "ai_move"),
+    ("engine", "TicTacToe", "get_strategic_move"),
+    ("engine", "TicTacToe", "check_winner"),
+    ("network", "NetworkManager", "send_move"),
+    ("gui", "TicTacToeGUI", "make_move"),
+    ("gui", "TicTacToeGUI", "_update_ai_move"),
+]
+
+SUB_BITS = 4
+SUB_BUCKETS = 1 << SUB_BITS
+PERCENTILES = (50, 95, 99)
+
+enabled = False
+_stats = {}
+_originals = []
+_finder = None
+_gauges = {}   # nom -> fonction qui retourne {clé: nombre}
+
+
+def _bucket(ns):
+    # Exact sous SUB_BUCKETS, puis SUB_BUCKETS paliers par puissance de 2
+    if ns < SUB_BUCKETS:
+        return max(ns, 0)
+    shift = ns.bit_length() - SUB_BITS - 1
+    return shift * SUB_BUCKETS + (ns >> shift)
+
+
+def _bucket_upper(index):
+    # Plus grande durée (ns) qui tombe dans le palier index
+    if index < 2 * SUB_BUCKETS:
+        return index
+    shift = index // SUB_BUCKETS - 1
+    top = index - shift * SUB_BUCKETS
+    return ((top + 1) << shift) - 1
+
+
+class Histogram:
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * (66 * SUB_BUCKETS)
+
+    def record(self, ns):
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.buckets[_bucket(ns)] += 1
+
+    def percentile(self, p):
+        """Durée (ns) sous laquelle tombent p % des appels (borne haute du palier)."""
+        if not self.count:
+            return 0
+        rank = self.count * p / 100
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min(_bucket_upper(index), self.max_ns)
+        return self.max_ns
+
+    def summary(self):
+        result = {"count": self.count,
+                  "mean_us": self.total_ns / self.count / 1000 if self.count else 0.0,
+                  "max_us": self.max_ns / 1000}
+        for p in PERCENTILES:
+            result[f"p{p}_us"] = self.percentile(p) / 1000
+        return result
+
+
+def histogram(name):
+    if name not in _stats:
+        _stats[name] = Histogram(name)
+    return _stats[name]
+
+
+def _timed(func, stat):
+    clock = time.perf_counter_ns
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stat.record(clock() - start)
+    return wrapper
+
+
+def instrument(owner, name, label=None):
+    """Mesure owner.name (méthode de classe ou fonction de module)."""
+    func = getattr(owner, name)
+    label = label or f"{getattr(owner, '__name__', owner)}.{name}"
+    _originals.append((owner, name, func))
+    setattr(owner, name, _timed(func, histogram(label)))
+
+
+class _LateInstrument(importlib.abc.MetaPathFinder):
+    """Mesure les cibles d'un module à son premier import (voir enable)."""
+
+    def __init__(self, pending):
+        self.pending = pending   # module -> [(classe, méthode)]
+        self._searching = False
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname not in self.pending or self._searching:
+            return None
+        self._searching = True
+        try:
+            spec = importlib.util.find_spec(fullname)
+        finally:
+            self._searching = False
+        if spec is None or spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return None
+        exec_module = spec.loader.exec_module
+        targets = self.pending.pop(fullname)
+
+        def exec_and_instrument(module):
+            exec_module(module)
+            for class_name, name in targets:
+                instrument(getattr(module, class_name), name)
+
+        spec.loader.exec_module = exec_and_instrument
+        return spec
+
+
+def enable(targets=TARGETS, json_path=None):
+    """Installe les mesures; les modules pas encore importés le seront à leur premier import."""
+    global enabled, _finder
+    if enabled:
+        return
+    enabled = True
+    pending = {}
+    for module_name, class_name, name in targets:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            instrument(getattr(module, class_name), name)
+        else:
+            pending.setdefault(module_name, []).append((class_name, name))
+    if pending:
+        _finder = _LateInstrument(pending)
+        sys.meta_path.insert(0, _finder)
+    if json_path:
+        atexit.register(write_json, json_path)
+        if hasattr(signal, "SIGUSR1") and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGUSR1, lambda signum, frame: write_json(json_path))
+
+
+def disable():
+    global enabled, _finder
+    if _finder is not None:
+        sys.meta_path.remove(_finder)
+        _finder = None
+    while _originals:
+        owner, name, func = _originals.pop()
+        setattr(owner, name, func)
+    enabled = False
+
+
+def reset():
+    _stats.clear()
+
+
+def gauge(name, func):
+    """Ajoute aux sorties les valeurs de func() (un dict {clé: nombre}), lues à chaque export."""
+    _gauges[name] = func
+
+
+def snapshot():
+    return {"time": time.time(),
+            "metrics": {name: stat.summary() for name, stat in sorted(_stats.items())},
+            "gauges": {name: func() for name, func in sorted(_gauges.items())}}
+
+
+def write_json(path):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(snapshot(), file, indent=2)
+
+
+def prometheus_text():
+    lines = []
+    for name, stat in sorted(_stats.items()):
+        metric = "tictactoe_" + name.replace(".", "_").lower()
+        lines.append(f"# TYPE {metric}_seconds summary")
+        for p in PERCENTILES:
+            lines.append(f'{metric}_seconds{{quantile="{p / 100}"}} {stat.percentile(p) / 1e9:.9f}')
+        lines.append(f"{metric}_seconds_sum {stat.total_ns / 1e9:.9f}")
+        lines.append(f"{metric}_seconds_count {stat.count}")
+    for name, func in sorted(_gauges.items()):
+        for key, value in sorted(func().items()):
+            metric = f"tictactoe_{name}_{key}".replace(".", "_").lower()
+            lines.append(f"# TYPE {metric} gauge")
+            lines.append(f"{metric} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def serve(port=9108, host="127.0.0.1"):
+    """Sert prometheus_text() en HTTP dans un thread de fond; retourne le serveur."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = prometheus_text().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class LagSampler:
+    """Mesure le retard de window.after : temps où la boucle Tk était occupée."""
+
+    def __init__(self, window, interval_ms=100):
+        self.window = window
+        self.interval_ms = interval_ms
+        self.stat = histogram("tk.loop_lag")
+        self._expected = time.perf_counter_ns() + interval_ms * 1_000_000
+        window.after(interval_ms, self._tick)
+
+    def _tick(self):
+        now = time.perf_counter_ns()
+        self.stat.record(max(0, now - self._expected))
+        self._expected = now + self.interval_ms * 1_000_000
+        self.window.after(self.interval_ms, self._tick)
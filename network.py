@@ -0,0 +1,166 @@
+# Connexion au serveur de jeu (voir server.py).
+
+import json
+import queue
+import socket
+import threading
+import time
+
+from codec import CODECS, CodecError, JsonCodec, hello_message
+
+
+def _show_error(message):
+    # tkinter n'est chargé que s'il faut vraiment afficher une erreur
+    from tkinter import messagebox
+    messagebox.showerror("Erreur", message)
+
+
+class NetworkManager:
+    # Messages JSON, un par ligne (même format que server.py), ou format
+    # binaire compact après negotiate() (voir codec.py)
+    def __init__(self, host='localhost', port=5000):
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.host = host
+        self.port = port
+        self.timeout = 5.0  # Timeout de 5 secondes
+        self.is_connected = False
+        self._lock = threading.Lock()
+        self._buffer = b""
+        self.codec = JsonCodec()
+        # Messages déjà décodés pendant la négociation
+        self._pending = []
+        # Messages reçus par le thread lecteur, en attente pour l'interface
+        self._inbox = queue.SimpleQueue()
+        self._drain_pending = False
+        self._reader = None
+        
+    def connect(self):
+        try:
+            self.socket.settimeout(self.timeout)
+            self.socket.connect((self.host, self.port))
+            self.is_connected = True
+            return True
+        except socket.timeout:
+            _show_error("Connexion au serveur trop longue")
+            return False
+        except ConnectionRefusedError:
+            _show_error("Serveur non disponible")
+            return False
+
+    def send_message(self, message):
+        if not self.is_connected:
+            return False
+        data = self.codec.encode(message)
+        with self._lock:
+            try:
+                # sendall : envoie tout le message, même en plusieurs morceaux
+                self.socket.sendall(data)
+                return True
+            except OSError:
+                self.is_connected = False
+                return False
+            
+    def send_move(self, position, seq=None):
+        # seq : numéro renvoyé par le serveur dans ack / error (voir prediction.py)
+        message = {
+            "type": "move",
+            "position": position,
+            "timestamp": time.time()
+        }
+        if seq is not None:
+            message["seq"] = seq
+        return self.send_message(message)
+
+    def negotiate(self, formats=("binary", "json")):
+        """Propose le format binaire au serveur; retourne le format retenu."""
+        self.send_message(hello_message(formats))
+        while True:
+            message = self._read_message()
+            if message is None:
+                return self.codec.name
+            if message.get("type") == "hello":
+                # Le serveur change de format juste après sa réponse
+                self.codec = CODECS[message.get("format", "json")]()
+                return self.codec.name
+            self._pending.append(message)
+
+    def receive_message(self):
+        # Lecture bloquante d'un message complet; None si la connexion est fermée
+        if self._pending:
+            return self._pending.pop(0)
+        return self._read_message()
+
+    def _read_message(self):
+        while True:
+            message, self._buffer = self.codec.decode_one(self._buffer)
+            if message is not None:
+                return message
+            chunk = self.socket.recv(4096)
+            if not chunk:
+                self.is_connected = False
+                return None
+            self._buffer += chunk
+
+    def receive_data(self):
+        # Lecture bloquante d'un seul message, en texte JSON (à ne pas appeler depuis l'interface)
+        message = self.receive_message()
+        if message is None:
+            return ""
+        return json.dumps(message)
+
+    def start_reader(self, window, on_message, negotiate=False):
+        """Lance un thread qui lit les messages et les livre à on_message via window.after.
+
+        Avec negotiate, l'échange "hello" (voir negotiate) se fait aussi sur ce
+        thread : un serveur qui ne répond pas ne bloque pas l'interface.
+        """
+        self._window = window
+        self._on_message = on_message
+        self._negotiate = negotiate
+        if not negotiate:
+            self.socket.settimeout(None)
+        self._reader = threading.Thread(target=self._reader_loop, daemon=True)
+        self._reader.start()
+
+    def _reader_loop(self):
+        try:
+            if self._negotiate:
+                try:
+                    self.negotiate()
+                except socket.timeout:
+                    pass   # pas de réponse au "hello" : on reste en JSON
+                self.socket.settimeout(None)
+            while True:
+                message = self.receive_message()
+                if message is None:
+                    break
+                self._inbox.put(message)
+                self._schedule_drain()
+        except (OSError, CodecError):
+            pass
+        self.is_connected = False
+        self._inbox.put({"type": "disconnected"})
+        self._schedule_drain()
+
+    def _schedule_drain(self):
+        # Un seul appel à window.after pour toute une rafale de messages
+        if not self._drain_pending:
+            self._drain_pending = True
+            self._window.after(0, self._drain)
+
+    def _drain(self):
+        self._drain_pending = False
+        while True:
+            try:
+                message = self._inbox.get_nowait()
+            except queue.Empty:
+                break
+            self._on_message(message)
+
+    def close(self):
+        self.is_connected = False
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.socket.close()
@@ -0,0 +1,110 @@
+# Prédiction des coups en ligne : afficher son coup sans attendre le serveur.
+#
+# Le coup du joueur est appliqué tout de suite au TicTacToe affiché et
+# envoyé avec un numéro de séquence. Le serveur reste l'autorité : on garde
+# à part l'état confirmé (coups acquittés et coups de l'adversaire) et la
+# liste des coups en attente. À chaque réponse :
+#
+#     ack    -> le coup en attente passe dans l'état confirmé; mesure du RTT
+#     error  -> coup refusé : retour à l'état confirmé (rollback)
+#     move   -> coup de l'adversaire ajouté à l'état confirmé; s'il tombe sur
+#               une case prédite, la prédiction était fausse : rollback
+#
+# Après un rollback, le plateau affiché = état confirmé + coups encore en attente.
+# Le RTT est lissé comme dans TCP (srtt = 7/8 srtt + 1/8 mesure).
+
+import time
+from collections import deque
+
+from engine import TicTacToe
+
+
+class Prediction:
+    def __init__(self, game, network):
+        # game : le TicTacToe affiché par l'interface
+        self.game = game
+        self.network = network
+        self.confirmed = TicTacToe(game.size, game.k)
+        self.pending = deque()     # (seq, position, joueur, heure d'envoi)
+        self._seq = 0
+        self.rtt_ms = None         # RTT lissé
+        self.last_rtt_ms = None
+        self.rollbacks = 0
+
+    def reset(self):
+        self.confirmed.reset()
+        self.pending.clear()
+
+    def play(self, position, player):
+        """Applique le coup localement et l'envoie; False si le coup est invalide ici."""
+        if not self.game.make_move(position, player):
+            return False
+        self._seq += 1
+        self.pending.append((self._seq, position, player, time.perf_counter()))
+        if not self.network.send_move(position, seq=self._seq):
+            self.rollback()
+            return False
+        return True
+
+    def on_message(self, message):
+        """Traite une réponse du serveur; retourne True si le plateau affiché a été reconstruit."""
+        kind = message.get("type")
+        if kind == "ack":
+            entry = self._take(message)
+            if entry is None:
+                return False
+            _, position, player, sent = entry
+            self.confirmed.make_move(position, player)
+            self._measure(sent)
+            return False
+        if kind == "error":
+            if self._take(message) is None:
+                return False
+            self.rollback()
+            return True
+        if kind == "move":
+            position = message.get("position")
+            player = message.get("player")
+            if not isinstance(position, int):
+                return False
+            self.confirmed.make_move(position, player)
+            if any(pending[1] == position for pending in self.pending):
+                self.pending.clear()
+                self.rollback()
+                return True
+            self.game.make_move(position, player)
+            return False
+        return False
+
+    def _take(self, message):
+        # Réponse au plus ancien coup en attente (TCP garde l'ordre); le seq le confirme
+        if not self.pending:
+            return None
+        seq = message.get("seq")
+        if seq is not None and seq != self.pending[0][0]:
+            return None
+        return self.pending.popleft()
+
+    def _measure(self, sent):
+        sample = (time.perf_counter() - sent) * 1000
+        self.last_rtt_ms = sample
+        self.rtt_ms = sample if self.rtt_ms is None else 0.875 * self.rtt_ms + 0.125 * sample
+
+    def rollback(self):
+        """Plateau affiché = état confirmé + coups encore en attente."""
+        self.rollbacks += 1
+        game = self.game
+        game.reset()
+        for position, player in zip(self.confirmed.moves, self._players(self.confirmed)):
+            game.make_move(position, player)
+        kept = deque()
+        for entry in self.pending:
+            if game.make_move(entry[1], entry[2]):
+                kept.append(entry)
+        self.pending = kept
+
+    @staticmethod
+    def _players(game):
+        # Coups de l'état confirmé : X et O alternent, X commence
+        for position in game.moves:
+            yield "X" if game.mask_x >> position & 1 else "O"
@@ -0,0 +1,90 @@
+# Rendu des cases du plateau Tk : seulement ce qui a changé.
+#
+# Chaque appel à widget.config() est un aller-retour vers l'interpréteur Tcl.
+# Le CellRenderer garde, pour chaque case, l'état voulu et le dernier état
+# réellement envoyé à Tk (texte, couleurs, état, police). Les changements
+# sont regroupés et envoyés une fois par passage de la boucle d'événements
+# (after_idle), avec un seul config() par case modifiée et uniquement les
+# attributs qui ont changé. Fonctionne pour n'importe quelle taille N x N.
+# stats() résume les appels Tk par coup (gui.py l'expose dans metrics.py).
+
+from collections import deque
+
+
+class CellProxy:
+    """Se comporte comme un widget pour config(); passe par le renderer."""
+
+    def __init__(self, renderer, index):
+        self.renderer = renderer
+        self.index = index
+
+    def config(self, **attrs):
+        self.renderer.set(self.index, **attrs)
+
+    configure = config
+
+
+class CellRenderer:
+    def __init__(self, window, widgets, initial):
+        # initial : attributs donnés aux widgets à leur création
+        self.window = window
+        self.widgets = widgets
+        self.rendered = [dict(initial) for _ in widgets]
+        self.wanted = [dict(initial) for _ in widgets]
+        self.dirty = set()
+        self._flush_id = None
+        # Mesures
+        self.tk_calls = 0
+        self.flushes = 0
+        self.calls_per_move = deque(maxlen=100)
+        self._calls_at_move = 0
+
+    def set(self, index, **attrs):
+        wanted = self.wanted[index]
+        changed = False
+        for name, value in attrs.items():
+            if wanted.get(name) != value:
+                wanted[name] = value
+                changed = True
+        if changed:
+            self.dirty.add(index)
+            if self._flush_id is None:
+                self._flush_id = self.window.after_idle(self.flush)
+
+    def set_all(self, **attrs):
+        for index in range(len(self.widgets)):
+            self.set(index, **attrs)
+
+    def get(self, index, name):
+        return self.wanted[index].get(name)
+
+    def cell(self, index):
+        return CellProxy(self, index)
+
+    def flush(self):
+        self._flush_id = None
+        for index in self.dirty:
+            rendered = self.rendered[index]
+            changes = {name: value for name, value in self.wanted[index].items()
+                       if rendered.get(name) != value}
+            if changes:
+                self.widgets[index].config(**changes)
+                rendered.update(changes)
+                self.tk_calls += 1
+        self.dirty.clear()
+        self.flushes += 1
+
+    def mark_move(self):
+        """Note le nombre d'appels Tk depuis le coup précédent."""
+        self.calls_per_move.append(self.tk_calls - self._calls_at_move)
+        self._calls_at_move = self.tk_calls
+
+    def stats(self):
+        moves = self.calls_per_move
+        return {
+            "tk_calls": self.tk_calls,
+            "flushes": self.flushes,
+            "last_calls_per_move": moves[-1] if moves else 0,
+            "avg_calls_per_move": round(sum(moves) / len(moves), 2) if moves else 0.0,
+            "max_calls_per_move": max(moves, default=0),
+        }
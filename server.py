@@ -0,0 +1,291 @@
+# Serveur de parties en réseau pour NetworkManager (asyncio, un seul processus).
+#
+# Chaque client qui se connecte attend un adversaire; dès que deux clients
+# attendent, une partie commence (le premier joue X). Le serveur garde son
+# propre TicTacToe pour chaque partie, refuse les coups invalides et relaie
+# les coups acceptés à l'adversaire. Une seule boucle asyncio gère toutes
+# les connexions : pas de thread par client.
+#
+# Messages : objets JSON, un par ligne. Les objets collés sans saut de ligne
+# (ancien NetworkManager) sont aussi acceptés. Un client peut négocier le
+# format binaire compact avec un message "hello" (voir codec.py).
+#
+#   client -> serveur : {"type": "move", "position": 4, "timestamp": ..., "seq": 1}
+#                       {"type": "hello", "formats": ["binary", "json"]}
+#   serveur -> client : {"type": "waiting"}
+#                       {"type": "start", "match": 7, "symbol": "X"}
+#                       {"type": "ack", "position": 4, "seq": 1}
+#                       {"type": "move", "position": 4, "player": "X", "timestamp": ...}
+#                       {"type": "hello", "format": "binary"}
+#                       {"type": "error", "reason": "...", "seq": 1}
+#                       {"type": "end", "winner": "X" | "O" | null, "reason": "..."}
+#
+# "seq" est facultatif : s'il est dans le coup, il est renvoyé dans la réponse.
+# Après "end", le serveur ferme la connexion; pour rejouer, le client se
+# reconnecte et revient dans la file d'attente.
+#
+# Avec --spectator-port, les parties sont aussi diffusées en lecture seule
+# aux spectateurs (voir broadcast.py).
+#
+# Exemple :
+#     python server.py --port 5000 --spectator-port 5001
+
+import argparse
+import asyncio
+import itertools
+import logging
+import time
+
+from broadcast import SpectatorHub
+from codec import CODECS, CodecError, JsonCodec, choose_format
+from engine import TicTacToe
+from game_log import GameLog
+
+logger = logging.getLogger(__name__)
+
+MAX_MESSAGE = 4096            # taille max d'un message non terminé
+WRITE_BUFFER_LIMIT = 64 * 1024  # au-delà, le client est trop lent : on le déconnecte
+
+
+class Player:
+    def __init__(self, server, reader, writer):
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.match = None
+        self.symbol = None
+        self.codec = JsonCodec()
+        self.peer = writer.get_extra_info("peername")
+
+    def send(self, message):
+        if self.writer.is_closing():
+            return
+        self.writer.write(self.codec.encode(message))
+        if self.writer.transport.get_write_buffer_size() > WRITE_BUFFER_LIMIT:
+            logger.warning("client trop lent, déconnexion: %s", self.peer)
+            self.close()
+
+    def close(self):
+        if not self.writer.is_closing():
+            self.writer.close()
+
+
+class Match:
+    def __init__(self, server, match_id, player_x, player_o):
+        self.server = server
+        self.id = match_id
+        self.game = TicTacToe()
+        self.players = {"X": player_x, "O": player_o}
+        self.turn = "X"
+        self.finished = False
+        self.started = time.time()
+        self._timer = None
+        for symbol, player in self.players.items():
+            player.match = self
+            player.symbol = symbol
+            player.send({"type": "start", "match": match_id, "symbol": symbol})
+        if server.hub is not None:
+            server.hub.open(match_id, self.game.size)
+        self._arm_timer()
+
+    def _arm_timer(self):
+        # Un seul minuteur par partie (call_later), pas de tâche dédiée
+        if self._timer is not None:
+            self._timer.cancel()
+        loop = asyncio.get_running_loop()
+        self._timer = loop.call_later(self.server.move_timeout, self._on_timeout)
+
+    def _on_timeout(self):
+        loser = self.turn
+        self.finish("O" if loser == "X" else "X", "timeout")
+
+    def play(self, player, position, seq=None):
+        if self.finished:
+            return
+        reply = {} if seq is None else {"seq": seq}
+        if player.symbol != self.turn:
+            player.send({"type": "error", "reason": "pas votre tour", **reply})
+            return
+        if (not isinstance(position, int) or not 0 <= position < len(self.game.board)
+                or not self.game.make_move(position, player.symbol)):
+            player.send({"type": "error", "reason": "coup invalide", "position": position, **reply})
+            return
+
+        opponent = self.players["O" if player.symbol == "X" else "X"]
+        move = {"type": "move", "position": position,
+                "player": player.symbol, "timestamp": time.time()}
+        player.send({"type": "ack", "position": position, **reply})
+        opponent.send(move)
+        if self.server.hub is not None:
+            self.server.hub.publish(self.id, dict(move, match=self.id))
+
+        if self.game.check_winner(player.symbol):
+            self.finish(player.symbol, "victoire")
+        elif not self.game.get_empty_spaces():
+            self.finish(None, "nul")
+        else:
+            self.turn = opponent.symbol
+            self._arm_timer()
+
+    def leave(self, player):
+        if not self.finished:
+            self.finish("O" if player.symbol == "X" else "X", "déconnexion")
+
+    def finish(self, winner, reason):
+        if self.finished:
+            return
+        self.finished = True
+        if self._timer is not None:
+            self._timer.cancel()
+        for player in self.players.values():
+            player.send({"type": "end", "winner": winner, "reason": reason})
+            player.match = None
+            # Une partie par connexion : le client se reconnecte pour rejouer
+            player.close()
+        if self.server.hub is not None:
+            self.server.hub.publish(self.id, {"type": "end", "match": self.id,
+                                              "winner": winner, "reason": reason})
+        self.server.matches.pop(self.id, None)
+        self.server.games_finished += 1
+        if self.server.game_log is not None:
+            result = winner if reason in ("victoire", "nul") else "abandon"
+            try:
+                self.server.game_log.record_game(self.game, "online", result, self.started)
+            except OSError as error:
+                # Un journal illisible ou plein ne doit pas arrêter le serveur
+                logger.warning("partie %s non journalisée : %s", self.id, error)
+
+
+class GameServer:
+    def __init__(self, host="localhost", port=5000, move_timeout=30.0, idle_timeout=120.0,
+                 game_log=None, spectator_port=None):
+        self.host = host
+        # Diffusion aux spectateurs, seulement si un port est donné (0 = port libre)
+        self.hub = SpectatorHub(host, spectator_port) if spectator_port is not None else None
+        # GameLog optionnel : toutes les parties terminées y sont ajoutées
+        self.game_log = game_log
+        self.port = port
+        self.move_timeout = move_timeout
+        self.idle_timeout = idle_timeout
+        self.waiting = None
+        self.matches = {}
+        self.games_finished = 0
+        self._ids = itertools.count(1)
+        self._server = None
+
+    async def start(self):
+        # File d'attente large : des milliers de clients peuvent arriver en même temps
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port,
+                                                  backlog=4096)
+        # Port réel (utile avec port=0 pour les tests locaux)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("serveur à l'écoute sur %s:%s", self.host, self.port)
+        if self.hub is not None:
+            await self.hub.start()
+        return self._server
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for match in list(self.matches.values()):
+            match.finish(None, "arrêt du serveur")
+        if self.hub is not None:
+            await self.hub.close()
+
+    def _matchmake(self, player):
+        if self.waiting is None or self.waiting.writer.is_closing():
+            self.waiting = player
+            player.send({"type": "waiting"})
+            return
+        opponent, self.waiting = self.waiting, None
+        match_id = next(self._ids)
+        self.matches[match_id] = Match(self, match_id, opponent, player)
+
+    async def _handle_client(self, reader, writer):
+        player = Player(self, reader, writer)
+        self._matchmake(player)
+        buffer = b""
+        try:
+            while True:
+                data = await asyncio.wait_for(reader.read(4096), self.idle_timeout)
+                if not data:
+                    break
+                buffer = self._dispatch(player, buffer + data)
+                if buffer is None:
+                    break
+                if len(buffer) > MAX_MESSAGE:
+                    player.send({"type": "error", "reason": "message trop long"})
+                    break
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            if self.waiting is player:
+                self.waiting = None
+            if player.match is not None:
+                player.match.leave(player)
+            player.close()
+
+    def _dispatch(self, player, buffer):
+        """Traite tous les messages complets du tampon; retourne le reste.
+
+        Retourne None si le flux est illisible et que la connexion doit être fermée.
+        """
+        while buffer:
+            try:
+                message, buffer = player.codec.decode_one(buffer)
+            except CodecError as error:
+                player.send({"type": "error", "reason": str(error)})
+                if player.codec.name != "json":
+                    return None
+                # En JSON, on saute simplement la ligne illisible
+                buffer = buffer.split(b"\n", 1)[1]
+                continue
+            if message is None:
+                break
+            self._handle_message(player, message)
+        return buffer
+
+    def _handle_message(self, player, message):
+        if not isinstance(message, dict):
+            return
+        kind = message.get("type")
+        if kind == "move":
+            if player.match is None:
+                player.send({"type": "error", "reason": "aucune partie en cours"})
+            else:
+                player.match.play(player, message.get("position"), message.get("seq"))
+        elif kind == "hello":
+            name = choose_format(message)
+            # La réponse part encore dans l'ancien format, puis on change
+            player.send({"type": "hello", "format": name})
+            player.codec = CODECS[name]()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serveur TicTacToe en réseau")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--move-timeout", type=float, default=30.0)
+    parser.add_argument("--log", help="journal des parties (voir game_log.py)")
+    parser.add_argument("--spectator-port", type=int, help="port des spectateurs (voir broadcast.py)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    game_log = GameLog(args.log) if args.log else None
+    server = GameServer(args.host, args.port, move_timeout=args.move_timeout, game_log=game_log,
+                        spectator_port=args.spectator_port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\nServeur arrêté")
+
+
+if __name__ == "__main__":
+    main()
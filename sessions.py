@@ -0,0 +1,255 @@
+# Stockage compact de beaucoup de parties dans un seul processus.
+#
+# Un TicTacToe coûte plusieurs centaines d'octets : son __dict__, un Board
+# avec ses compteurs par ligne, la liste des coups... Le SessionStore garde
+# toutes les parties en cours dans des tableaux typés préalloués, une case
+# par partie (slot) :
+#
+#     mask_x, mask_o   plateau, un bit par case (H, I ou Q selon la taille)
+#     score_x, score_o scores (H)
+#     difficulty       code de difficulté, index dans engine.STRATEGIES (B)
+#     turn             0 = au tour de X, 1 = au tour de O (B)
+#     generation       incrémenté à chaque libération, pour repérer les vieux handles (I)
+#
+# Les slots libérés sont réutilisés (liste libre) et les tableaux doublent
+# quand tout est plein. open() retourne un Session à __slots__ avec la même
+# API que TicTacToe : make_move, check_winner, get_empty_spaces, ai_move.
+#
+# Exemple :
+#     python sessions.py --count 100000    # octets par partie, comparés à TicTacToe
+
+import argparse
+from array import array
+
+from board import geometry, iter_bits
+from engine import STRATEGIES, TicTacToe
+
+PLAYERS = ("X", "O")
+
+
+def _mask_type(cells):
+    for code in ("H", "I", "Q"):
+        if cells <= array(code).itemsize * 8:
+            return code
+    raise ValueError(f"plateau trop grand pour le SessionStore ({cells} cases, 64 au plus)")
+
+
+class SessionStore:
+    def __init__(self, capacity=1024, size=3, k=3):
+        geo = geometry(size, k)
+        self.size = size
+        self.k = k
+        self.full_mask = geo.full_mask
+        self.line_masks = geo.line_masks
+        mask_type = _mask_type(geo.cells)
+        # Petits plateaux : table « masque -> gagnant ? » (512 octets en 3x3)
+        self._wins = None
+        if geo.cells <= 16:
+            self._wins = bytearray(1 << geo.cells)
+            for line in self.line_masks:
+                for mask in range(1 << geo.cells):
+                    if mask & line == line:
+                        self._wins[mask] = 1
+        self.mask_x = array(mask_type, bytes(capacity * array(mask_type).itemsize))
+        self.mask_o = array(mask_type, self.mask_x)
+        self.score_x = array("H", bytes(2 * capacity))
+        self.score_o = array("H", self.score_x)
+        self.difficulty = array("B", bytes(capacity))
+        self.turn = array("B", bytes(capacity))
+        self.generation = array("I", bytes(4 * capacity))
+        self.in_use = bytearray(capacity)
+        self._free = array("I", range(capacity - 1, -1, -1))   # slots libres (pile)
+        self.live = 0
+
+    @property
+    def capacity(self):
+        return len(self.turn)
+
+    def _grow(self):
+        old = self.capacity
+        for column in (self.mask_x, self.mask_o, self.score_x, self.score_o,
+                       self.difficulty, self.turn, self.generation):
+            column.extend(array(column.typecode, bytes(old * column.itemsize)))
+        self.in_use.extend(bytes(old))
+        self._free.extend(array("I", range(2 * old - 1, old - 1, -1)))
+
+    def open(self, difficulty="facile"):
+        """Nouvelle partie vide; retourne son Session."""
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        self.mask_x[slot] = self.mask_o[slot] = 0
+        self.score_x[slot] = self.score_o[slot] = 0
+        self.difficulty[slot] = STRATEGIES.index(difficulty)
+        self.turn[slot] = 0
+        self.in_use[slot] = 1
+        self.live += 1
+        return Session(self, slot, self.generation[slot])
+
+    def close(self, slot):
+        if not self.in_use[slot]:
+            return
+        self.in_use[slot] = 0
+        self.generation[slot] = (self.generation[slot] + 1) & 0xFFFFFFFF
+        self._free.append(slot)
+        self.live -= 1
+
+    def is_winner(self, slot, player):
+        mask = self.mask_x[slot] if player == "X" else self.mask_o[slot]
+        if self._wins is not None:
+            return self._wins[mask] == 1
+        for line in self.line_masks:
+            if mask & line == line:
+                return True
+        return False
+
+    def bytes_per_session(self):
+        """Mémoire des tableaux par slot (sans les handles Session)."""
+        columns = (self.mask_x, self.mask_o, self.score_x, self.score_o,
+                   self.difficulty, self.turn, self.generation, self._free)
+        return sum(column.itemsize for column in columns) + 1   # + in_use
+
+
+class Session:
+    """Une partie du SessionStore, avec l'API de TicTacToe."""
+
+    __slots__ = ("store", "slot", "generation")
+
+    def __init__(self, store, slot, generation):
+        self.store = store
+        self.slot = slot
+        self.generation = generation
+
+    def _check(self):
+        if self.store.generation[self.slot] != self.generation:
+            raise ValueError("session fermée")
+        return self.slot
+
+    @property
+    def size(self):
+        return self.store.size
+
+    @property
+    def k(self):
+        return self.store.k
+
+    @property
+    def mask_x(self):
+        return self.store.mask_x[self._check()]
+
+    @property
+    def mask_o(self):
+        return self.store.mask_o[self._check()]
+
+    @property
+    def difficulty(self):
+        return STRATEGIES[self.store.difficulty[self._check()]]
+
+    @difficulty.setter
+    def difficulty(self, value):
+        self.store.difficulty[self._check()] = STRATEGIES.index(value)
+
+    @property
+    def score_x(self):
+        return self.store.score_x[self._check()]
+
+    @score_x.setter
+    def score_x(self, value):
+        self.store.score_x[self._check()] = value
+
+    @property
+    def score_o(self):
+        return self.store.score_o[self._check()]
+
+    @score_o.setter
+    def score_o(self, value):
+        self.store.score_o[self._check()] = value
+
+    @property
+    def to_move(self):
+        return PLAYERS[self.store.turn[self._check()]]
+
+    @property
+    def board(self):
+        x, o = self.mask_x, self.mask_o
+        return ["X" if x >> i & 1 else "O" if o >> i & 1 else " "
+                for i in range(self.store.size ** 2)]
+
+    def empty_mask(self):
+        slot = self._check()
+        store = self.store
+        return store.full_mask & ~(store.mask_x[slot] | store.mask_o[slot])
+
+    def get_empty_spaces(self):
+        return list(iter_bits(self.empty_mask()))
+
+    def make_move(self, position, player):
+        slot = self._check()
+        store = self.store
+        if not 0 <= position < store.size ** 2:
+            return False
+        bit = 1 << position
+        if (store.mask_x[slot] | store.mask_o[slot]) & bit:
+            return False
+        if player == "X":
+            store.mask_x[slot] |= bit
+        else:
+            store.mask_o[slot] |= bit
+        store.turn[slot] = 1 if player == "X" else 0
+        return True
+
+    def check_winner(self, player):
+        return self.store.is_winner(self._check(), player)
+
+    def reset(self):
+        slot = self._check()
+        self.store.mask_x[slot] = self.store.mask_o[slot] = 0
+        self.store.turn[slot] = 0
+
+    def snapshot(self):
+        """Même format que TicTacToe.snapshot()."""
+        return (self.size, self.k, self.mask_x, self.mask_o, self.difficulty)
+
+    def ai_move(self, player="O"):
+        # L'IA travaille sur un TicTacToe temporaire, recréé depuis la copie figée
+        return TicTacToe.from_snapshot(self.snapshot()).ai_move(player)
+
+    def close(self):
+        self.store.close(self._check())
+
+
+def measure(count):
+    """Octets par partie (tracemalloc) : TicTacToe contre SessionStore."""
+    import tracemalloc
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    games = [TicTacToe() for _ in range(count)]
+    for game in games:
+        game.make_move(4, "X")
+    per_game = (tracemalloc.get_traced_memory()[0] - before) / count
+    del games
+
+    before = tracemalloc.get_traced_memory()[0]
+    store = SessionStore(capacity=count)
+    for _ in range(count):
+        store.open().make_move(4, "X")   # handle non gardé : seul le slot occupe de la mémoire
+    per_slot = (tracemalloc.get_traced_memory()[0] - before) / count
+    tracemalloc.stop()
+    return {"tictactoe": per_game, "session_store": per_slot,
+            "session_store_arrays": store.bytes_per_session()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mémoire par partie : TicTacToe et SessionStore")
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    result = measure(args.count)
+    print(f"TicTacToe     : {result['tictactoe']:8.1f} octets par partie")
+    print(f"SessionStore  : {result['session_store']:8.1f} octets par partie "
+          f"(tableaux : {result['session_store_arrays']})")
+    print(f"rapport       : {result['tictactoe'] / result['session_store']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
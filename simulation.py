@@ -0,0 +1,183 @@
+# Simulation de parties IA contre IA en lot, sans interface (nécessite NumPy).
+#
+# B parties sont gardées dans un tableau (B, 9) de int8 : 0 = vide,
+# 1 = X, -1 = O. À chaque tour, toutes les parties encore en cours jouent
+# en même temps : tirage aléatoire, coup stratégique (gagner / bloquer)
+# ou coup parfait (table du solveur) selon la difficulté, puis les 8
+# lignes gagnantes de toutes les parties sont testées d'un seul coup.
+#
+# Exemple :
+#     python simulation.py --games 1000000 --x medium --o difficile
+
+import argparse
+import time
+
+import numpy as np
+
+from board import FULL_MASK, WINS, has_win, iter_bits
+from engine import self_play
+
+LINES = np.array(WINS, dtype=np.intp)            # (8, 3)
+POWERS = (3 ** np.arange(9)).astype(np.int32)    # code base 3 d'un plateau
+
+# Probabilité de jouer un coup « intelligent » (mêmes valeurs que TicTacToe.ai_move)
+STRATEGIC_CHANCE = {"facile": 0.0, "medium": 0.5, "difficile": 0.75}
+
+_perfect_table = None
+
+
+def _build_perfect_table():
+    """Table (3**9, 9) : meilleurs coups pour chaque plateau atteignable."""
+    import solver
+
+    table = np.zeros((3 ** 9, 9), dtype=bool)
+    seen = set()
+    stack = [(0, 0)]
+    while stack:
+        mask_x, mask_o = stack.pop()
+        if (mask_x, mask_o) in seen:
+            continue
+        seen.add((mask_x, mask_o))
+        if has_win(mask_x) or has_win(mask_o):
+            continue
+        empty = FULL_MASK & ~(mask_x | mask_o)
+        if not empty:
+            continue
+        code = 0
+        for i in iter_bits(mask_x):
+            code += 3 ** i
+        for i in iter_bits(mask_o):
+            code += 2 * 3 ** i
+        table[code, solver.best_moves(mask_x, mask_o)] = True
+        x_to_move = bin(mask_x).count("1") == bin(mask_o).count("1")
+        for pos in iter_bits(empty):
+            if x_to_move:
+                stack.append((mask_x | (1 << pos), mask_o))
+            else:
+                stack.append((mask_x, mask_o | (1 << pos)))
+    return table
+
+
+def perfect_table():
+    global _perfect_table
+    if _perfect_table is None:
+        _perfect_table = _build_perfect_table()
+    return _perfect_table
+
+
+def winners(boards):
+    """1 si X a gagné, -1 si O a gagné, 0 sinon, pour chaque partie."""
+    sums = boards[:, LINES].sum(axis=2, dtype=np.int8)   # (B, 8)
+    result = np.zeros(len(boards), dtype=np.int8)
+    result[(sums == 3).any(axis=1)] = 1
+    result[(sums == -3).any(axis=1)] = -1
+    return result
+
+
+def random_moves(boards, rng):
+    # Un score aléatoire par case, -1 pour les cases occupées : argmax = case vide au hasard
+    scores = rng.random(boards.shape)
+    scores[boards != 0] = -1.0
+    return scores.argmax(axis=1)
+
+
+def strategic_moves(boards, player, rng):
+    """Gagner si possible, sinon bloquer, sinon case vide au hasard."""
+    moves = random_moves(boards, rng)
+    cells = boards[:, LINES]                       # (B, 8, 3)
+    sums = cells.sum(axis=2, dtype=np.int8)        # (B, 8)
+    empty_in_line = (cells == 0).argmax(axis=2)    # (B, 8)
+    cell_index = LINES[np.arange(8), empty_in_line]
+    # On applique le blocage puis la victoire, pour que la victoire soit prioritaire
+    for target in (-2 * player, 2 * player):
+        hits = sums == target
+        found = hits.any(axis=1)
+        line = hits.argmax(axis=1)
+        moves[found] = cell_index[found, line[found]]
+    return moves
+
+
+def perfect_moves(boards, rng):
+    codes = (boards.astype(np.int32) % 3) @ POWERS
+    best = perfect_table()[codes]
+    scores = rng.random(boards.shape)
+    scores[~best] = -1.0
+    return scores.argmax(axis=1)
+
+
+def choose_moves(boards, player, difficulty, rng):
+    moves = random_moves(boards, rng)
+    chance = STRATEGIC_CHANCE[difficulty]
+    if chance:
+        smart = rng.random(len(boards)) < chance
+        if smart.any():
+            if difficulty == "difficile":
+                moves[smart] = perfect_moves(boards[smart], rng)
+            else:
+                moves[smart] = strategic_moves(boards[smart], player, rng)
+    return moves
+
+
+def simulate_batch(games, difficulty_x="facile", difficulty_o="facile",
+                   seed=None, batch_size=100_000):
+    """Joue `games` parties IA contre IA; retourne les totaux victoires / nuls."""
+    rng = np.random.default_rng(seed)
+    totals = {"x_wins": 0, "o_wins": 0, "draws": 0}
+    remaining = games
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        remaining -= size
+        boards = np.zeros((size, 9), dtype=np.int8)
+        result = np.zeros(size, dtype=np.int8)
+        active = np.arange(size)
+        for ply in range(9):
+            player = 1 if ply % 2 == 0 else -1
+            difficulty = difficulty_x if player == 1 else difficulty_o
+            current = boards[active]
+            moves = choose_moves(current, player, difficulty, rng)
+            current[np.arange(len(active)), moves] = player
+            boards[active] = current
+            if ply >= 4:
+                won = winners(current)
+                done = won != 0
+                result[active[done]] = won[done]
+                active = active[~done]
+                if len(active) == 0:
+                    break
+        totals["x_wins"] += int((result == 1).sum())
+        totals["o_wins"] += int((result == -1).sum())
+        totals["draws"] += int((result == 0).sum())
+    return totals
+
+
+def simulate_scalar(games, difficulty_x="facile", difficulty_o="facile"):
+    """Même simulation, une partie à la fois avec TicTacToe (référence)."""
+    return self_play(games, difficulty_x, difficulty_o)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulation de parties IA contre IA")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--scalar-games", type=int, default=20_000)
+    parser.add_argument("--x", default="medium", choices=list(STRATEGIC_CHANCE))
+    parser.add_argument("--o", default="difficile", choices=list(STRATEGIC_CHANCE))
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    perfect_table()  # construite avant de mesurer
+
+    start = time.perf_counter()
+    batch = simulate_batch(args.games, args.x, args.o, seed=args.seed)
+    batch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scalar = simulate_scalar(args.scalar_games, args.x, args.o)
+    scalar_time = time.perf_counter() - start
+
+    print(f"X = {args.x}, O = {args.o}")
+    print(f"Lot (NumPy) : {batch}  {args.games / batch_time:,.0f} parties/s")
+    print(f"Scalaire    : {scalar}  {args.scalar_games / scalar_time:,.0f} parties/s")
+
+
+if __name__ == "__main__":
+    main()
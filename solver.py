@@ -0,0 +1,142 @@
+# Solveur parfait pour le TicTacToe 3x3.
+#
+# Toutes les positions atteignables sont énumérées une seule fois à
+# l'importation. Chaque position est ramenée à sa forme canonique parmi
+# les 8 symétries du plateau (4 rotations x miroir), ce qui réduit les
+# ~5 500 positions à 765. Pour chaque forme canonique, la table garde la
+# valeur théorique (+1 gagné, 0 nul, -1 perdu pour le joueur qui doit
+# jouer) et le masque des meilleurs coups.
+#
+# Ensuite, trouver le meilleur coup est une simple recherche dans la table.
+
+from random import choice
+
+from board import FULL_MASK, has_win, iter_bits
+
+
+def _rotate(i):
+    # (ligne, colonne) -> (colonne, 2 - ligne)
+    row, col = divmod(i, 3)
+    return col * 3 + (2 - row)
+
+
+def _mirror(i):
+    row, col = divmod(i, 3)
+    return row * 3 + (2 - col)
+
+
+def _build_symmetries():
+    perms = []
+    perm = list(range(9))
+    for _ in range(4):
+        perms.append(tuple(perm))
+        perms.append(tuple(_mirror(p) for p in perm))
+        perm = [_rotate(p) for p in perm]
+    return perms
+
+
+# SYMMETRIES[s][i] = case où la case i est envoyée par la symétrie s
+SYMMETRIES = _build_symmetries()
+INVERSES = [SYMMETRIES.index(tuple(sorted(range(9), key=lambda i: perm[i])))
+            for perm in SYMMETRIES]
+
+
+def _build_mask_tables():
+    # Une table de 512 entrées par symétrie : masque -> masque transformé
+    tables = []
+    for perm in SYMMETRIES:
+        table = []
+        for mask in range(FULL_MASK + 1):
+            out = 0
+            for i in iter_bits(mask):
+                out |= 1 << perm[i]
+            table.append(out)
+        tables.append(table)
+    return tables
+
+
+MASK_TABLES = _build_mask_tables()
+
+
+def popcount(mask):
+    return bin(mask).count("1")
+
+
+def canonical(mask_x, mask_o):
+    """Retourne (clé canonique, indice de la symétrie utilisée)."""
+    best_key = None
+    best_sym = 0
+    for s, table in enumerate(MASK_TABLES):
+        key = table[mask_x] | (table[mask_o] << 9)
+        if best_key is None or key < best_key:
+            best_key = key
+            best_sym = s
+    return best_key, best_sym
+
+
+# clé canonique -> (valeur + 1) | (masque des meilleurs coups << 2)
+TABLE = {}
+
+
+def _solve(mask_x, mask_o):
+    key, sym = canonical(mask_x, mask_o)
+    packed = TABLE.get(key)
+    if packed is not None:
+        return (packed & 3) - 1
+
+    x_to_move = popcount(mask_x) == popcount(mask_o)
+    last = mask_o if x_to_move else mask_x
+    empty = FULL_MASK & ~(mask_x | mask_o)
+
+    best_value = 0
+    best = 0
+    if has_win(last):
+        best_value = -1
+    elif empty:
+        best_value = -2
+        for pos in iter_bits(empty):
+            bit = 1 << pos
+            if x_to_move:
+                value = -_solve(mask_x | bit, mask_o)
+            else:
+                value = -_solve(mask_x, mask_o | bit)
+            if value > best_value:
+                best_value = value
+                best = bit
+            elif value == best_value:
+                best |= bit
+
+    # Les meilleurs coups sont rangés dans le repère canonique
+    TABLE[key] = (best_value + 1) | (MASK_TABLES[sym][best] << 2)
+    return best_value
+
+
+def _lookup(mask_x, mask_o):
+    key, sym = canonical(mask_x, mask_o)
+    packed = TABLE.get(key)
+    if packed is None:
+        # Position hors de la table (plateau modifié à la main)
+        _solve(mask_x, mask_o)
+        packed = TABLE[key]
+    best = MASK_TABLES[INVERSES[sym]][packed >> 2]
+    return (packed & 3) - 1, best
+
+
+def position_value(mask_x, mask_o):
+    """Valeur théorique pour le joueur qui doit jouer (+1, 0 ou -1)."""
+    return _lookup(mask_x, mask_o)[0]
+
+
+def best_moves(mask_x, mask_o):
+    """Liste des coups optimaux pour le joueur qui doit jouer."""
+    return list(iter_bits(_lookup(mask_x, mask_o)[1]))
+
+
+def best_move(mask_x, mask_o, pick=choice):
+    moves = best_moves(mask_x, mask_o)
+    if not moves:
+        return None
+    return pick(moves)
+
+
+_solve(0, 0)
@@ -0,0 +1,64 @@
+# Tests du journal de candidate_store : fin interrompue, ligne abîmée au milieu.
+#
+# Exemple :
+#     python -m pytest -q test_candidate_store.py
+
+import os
+
+import pytest
+
+from candidate_store import CandidateStore, synthetic_records
+
+
+def _store_with(path, count):
+    store = CandidateStore(path)
+    for record in synthetic_records(count):
+        store.add(record)
+    return store
+
+
+def _journal(path):
+    return os.path.join(path, "candidats.jsonl")
+
+
+def test_adds_reach_the_journal_before_save(tmp_path):
+    store = _store_with(str(tmp_path), 3)
+    with open(_journal(str(tmp_path)), "rb") as file:
+        assert len(file.readlines()) == 3
+    store.close()
+
+
+def test_torn_last_line_is_dropped(tmp_path):
+    path = str(tmp_path)
+    _store_with(path, 5).close()
+    with open(_journal(path), "ab") as file:
+        file.write(b'{"_id": 5, "nom": "Inter')
+    store = CandidateStore(path)
+    assert store.count == 5
+    assert store.add(next(synthetic_records(1))) == 5
+    store.close()
+    with open(_journal(path), "rb") as file:
+        assert len(file.readlines()) == 6
+
+
+def test_corrupt_middle_line_is_kept_and_reported(tmp_path):
+    path = str(tmp_path)
+    store = _store_with(path, 5)
+    store._data.close()   # arrêt sans save() : tout le journal est à relire
+    with open(_journal(path), "rb") as file:
+        lines = file.readlines()
+    lines[1] = b"{pas du json}\n"
+    with open(_journal(path), "wb") as file:
+        file.writelines(lines)
+
+    with pytest.raises(ValueError, match="--rebuild"):
+        CandidateStore(path)
+    with open(_journal(path), "rb") as file:
+        assert file.readlines() == lines
+
+    store = CandidateStore(path, rebuild=True)
+    assert store.skipped == 1
+    assert store.count == 5
+    assert not store.is_alive(1)
+    assert [store.get(n)["nom"] for n in (0, 2, 3, 4)] == [f"Candidat {n}" for n in (0, 2, 3, 4)]
+    store.close()
@@ -0,0 +1,204 @@
+# Tournoi toutes rondes entre stratégies d'IA, avec classement Elo.
+#
+# Chaque paire de stratégies joue `games` parties; le premier joueur
+# alterne d'une partie à l'autre. Les parties sont réparties en paquets sur
+# un ProcessPoolExecutor. Chaque partie a sa propre graine (graine du
+# tournoi, paire, numéro de partie) et les recherches ne sont pas limitées
+# par le temps : les résultats ne dépendent pas du nombre de processus.
+# "alphabeta" repart d'une table de transposition vide à chaque paquet; comme
+# la table change ses coups, la taille des paquets (--chunk) fait partie de la
+# définition du tournoi, au même titre que la graine.
+#
+# Le classement est le maximum de vraisemblance du modèle de Bradley-Terry
+# (nul = demi-victoire), exprimé en Elo (moyenne 1500). Les intervalles de
+# confiance à 95 % viennent de l'information de Fisher; ils sont un peu
+# larges car les nuls réduisent en réalité la variance.
+#
+# Exemple :
+#     python tournament.py --games 100000 --strategies facile medium difficile
+
+import argparse
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+import alphabeta
+import mcts
+from engine import STRATEGIES, TicTacToe
+
+ELO_SCALE = 400 / math.log(10)
+
+
+def game_seed(seed, pair, index):
+    return (seed * 1_000 + pair) * 1_000_000_000 + index
+
+
+def play_game(game, first, second):
+    """Une partie, first joue X; retourne 1 si first gagne, -1 si second gagne, 0 si nul."""
+    game.reset()
+    player = "X"
+    while True:
+        game.difficulty = first if player == "X" else second
+        game.make_move(game.ai_move(player), player)
+        if game.check_winner(player):
+            return 1 if player == "X" else -1
+        if not game.get_empty_spaces():
+            return 0
+        player = "O" if player == "X" else "X"
+
+
+def play_chunk(a, b, pair, seed, start, count):
+    """Parties start..start+count-1 entre a et b; retourne (victoires a, victoires b, nuls)."""
+    # Table vide : le paquet ne dépend pas des paquets joués avant par ce processus
+    alphabeta._default = alphabeta.AlphaBeta(time_limit=None, table=alphabeta.TranspositionTable())
+    game = TicTacToe()
+    game.rng = rng = random.Random()
+    wins_a = wins_b = draws = 0
+    for index in range(start, start + count):
+        rng.seed(game_seed(seed, pair, index))
+        if index % 2 == 0:
+            result = play_game(game, a, b)
+        else:
+            result = -play_game(game, b, a)
+        if result > 0:
+            wins_a += 1
+        elif result < 0:
+            wins_b += 1
+        else:
+            draws += 1
+    return wins_a, wins_b, draws
+
+
+def _init_worker():
+    # Un seul processus par recherche MCTS : les processus du tournoi occupent déjà les cœurs.
+    # Arrêt au nombre d'itérations seulement, pas à une heure limite.
+    mcts._default = mcts.MCTS(workers=1, time_limit=None)
+
+
+def run_tournament(strategies, games, seed=0, workers=None, chunk=2_000):
+    """Toutes les paires jouent `games` parties; retourne {(a, b): [victoires a, victoires b, nuls]}."""
+    pairs = list(combinations(strategies, 2))
+    results = {pair: [0, 0, 0] for pair in pairs}
+    jobs = []
+    for pair_index, (a, b) in enumerate(pairs):
+        for start in range(0, games, chunk):
+            jobs.append((a, b, pair_index, seed, start, min(chunk, games - start)))
+
+    if workers == 1:
+        _init_worker()
+        outcomes = [play_chunk(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = [pool.submit(play_chunk, *job) for job in jobs]
+            outcomes = [future.result() for future in futures]
+
+    for (a, b, *_), outcome in zip(jobs, outcomes):
+        totals = results[(a, b)]
+        for i in range(3):
+            totals[i] += outcome[i]
+    return results
+
+
+def _invert(matrix):
+    # Gauss-Jordan; les matrices ont la taille du nombre de stratégies
+    n = len(matrix)
+    work = [row[:] + [1.0 if i == j else 0.0 for j in range(n)] for i, row in enumerate(matrix)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(work[r][col]))
+        work[col], work[pivot] = work[pivot], work[col]
+        scale = work[col][col]
+        work[col] = [value / scale for value in work[col]]
+        for r in range(n):
+            if r != col and work[r][col]:
+                factor = work[r][col]
+                work[r] = [value - factor * other for value, other in zip(work[r], work[col])]
+    return [row[n:] for row in work]
+
+
+def elo_ratings(strategies, results, prior_draws=1, iterations=10_000):
+    """Elo de chaque stratégie et demi-largeur de l'intervalle à 95 %.
+
+    prior_draws nuls fictifs par paire évitent un Elo infini quand une
+    stratégie ne perd jamais contre une autre.
+    """
+    n = len(strategies)
+    index = {name: i for i, name in enumerate(strategies)}
+    played = [[0.0] * n for _ in range(n)]
+    score = [0.0] * n
+    for (a, b), (wins_a, wins_b, draws) in results.items():
+        i, j = index[a], index[b]
+        total = wins_a + wins_b + draws + prior_draws
+        played[i][j] += total
+        played[j][i] += total
+        score[i] += wins_a + (draws + prior_draws) / 2
+        score[j] += wins_b + (draws + prior_draws) / 2
+
+    # Algorithme MM (Hunter 2004) pour Bradley-Terry
+    gamma = [1.0] * n
+    for _ in range(iterations):
+        new = []
+        for i in range(n):
+            denominator = sum(played[i][j] / (gamma[i] + gamma[j]) for j in range(n) if played[i][j])
+            new.append(score[i] / denominator if denominator else gamma[i])
+        mean_log = sum(math.log(g) for g in new) / n
+        new = [g / math.exp(mean_log) for g in new]
+        change = max(abs(math.log(x / y)) for x, y in zip(new, gamma))
+        gamma = new
+        if change < 1e-12:
+            break
+    ratings = [1500 + ELO_SCALE * math.log(g) for g in gamma]
+
+    # Information de Fisher (en points Elo); pseudo-inverse car seules les différences comptent
+    fisher = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(n):
+            if i != j and played[i][j]:
+                p = gamma[i] / (gamma[i] + gamma[j])
+                weight = played[i][j] * p * (1 - p) / ELO_SCALE ** 2
+                fisher[i][j] -= weight
+                fisher[i][i] += weight
+    shifted = _invert([[value + 1 / n for value in row] for row in fisher])
+    covariance = [[value - 1 / n for value in row] for row in shifted]
+    margins = [1.96 * math.sqrt(max(covariance[i][i], 0.0)) for i in range(n)]
+    return {name: (ratings[i], margins[i]) for name, i in index.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tournoi entre stratégies d'IA")
+    parser.add_argument("--strategies", nargs="+", default=["facile", "medium", "difficile"],
+                        choices=list(STRATEGIES))
+    parser.add_argument("--games", type=int, default=20_000, help="parties par paire de stratégies")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk", type=int, default=2_000, help="parties par tâche envoyée aux processus")
+    parser.add_argument("--json", help="écrit aussi les résultats dans ce fichier")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run_tournament(args.strategies, args.games, args.seed, args.workers, args.chunk)
+    elapsed = time.perf_counter() - start
+    total = sum(sum(r) for r in results.values())
+    ratings = elo_ratings(args.strategies, results)
+
+    print(f"{total:,} parties en {elapsed:.1f} s ({total / elapsed:,.0f} parties/s)\n")
+    for (a, b), (wins_a, wins_b, draws) in results.items():
+        print(f"{a:>10} - {b:<10} {wins_a:>9,} / {wins_b:>9,} / {draws:>9,} nuls")
+    print()
+    for name, (rating, margin) in sorted(ratings.items(), key=lambda item: -item[1][0]):
+        print(f"{name:10} {rating:7.1f} ± {margin:.1f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"seed": args.seed, "games_per_pair": args.games,
+                       "results": [{"a": a, "b": b, "wins_a": r[0], "wins_b": r[1], "draws": r[2]}
+                                   for (a, b), r in results.items()],
+                       "elo": {name: {"rating": rating, "ci95": margin}
+                               for name, (rating, margin) in ratings.items()}}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()